@@ -13,13 +13,18 @@ import os
 import sys
 from typing import TYPE_CHECKING
 
-from .api import PlatformDirsABC
+from .api import ChildDirs, DirKind, DirPath, DirPaths, DirsConfig, PlatformDirsABC, Scope, _as_path
+from .context import _current, scoped
+from .factory import PlatformDirsFactory
+from .layout import Layout, LayoutDir
+from .prefork import warmup
+from .provision import Provisioned, provision
 from .version import __version__
 from .version import __version_tuple__ as __version_info__
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Literal
+    from typing import Any, Literal
 
 if sys.platform == "win32":
     from platformdirs.windows import Windows as _Result
@@ -52,6 +57,24 @@ else:
 AppDirs = PlatformDirs  #: Backwards compatibility with appdirs
 
 
+def _scoped_dir(name: str, **params: Any) -> str:  # ruff:ignore[any-type]
+    """:returns: the ``*_dir`` directory ``name``, following the active :func:`scoped` block, if any"""
+    if (scope := _current.get()) is None:
+        return getattr(PlatformDirs(**params), name)
+    if (override := scope.overrides.get(name)) is not None:
+        return override
+    return getattr(PlatformDirs(**scope.apply(params)), name)
+
+
+def _scoped_path(name: str, **params: Any) -> Path:  # ruff:ignore[any-type]
+    """:returns: the ``*_path`` directory ``name``, following the active :func:`scoped` block, if any"""
+    if (scope := _current.get()) is None:
+        return getattr(PlatformDirs(**params), name)
+    if (override := scope.overrides.get(f"{name[:-5]}_dir")) is not None:
+        return _as_path(override)
+    return getattr(PlatformDirs(**scope.apply(params)), name)
+
+
 def user_data_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
     appname: str | None = None,
     appauthor: str | Literal[False] | None = None,
@@ -70,14 +93,15 @@ def user_data_dir(  # ruff:ignore[too-many-arguments, too-many-positional-argume
     :returns: data directory tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "user_data_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         roaming=roaming,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_data_dir
+    )
 
 
 def site_data_dir(
@@ -96,13 +120,14 @@ def site_data_dir(
     :returns: data directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_data_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         multipath=multipath,
         ensure_exists=ensure_exists,
-    ).site_data_dir
+    )
 
 
 def user_config_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -123,14 +148,15 @@ def user_config_dir(  # ruff:ignore[too-many-arguments, too-many-positional-argu
     :returns: config directory tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "user_config_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         roaming=roaming,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_config_dir
+    )
 
 
 def site_config_dir(
@@ -149,13 +175,14 @@ def site_config_dir(
     :returns: config directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_config_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         multipath=multipath,
         ensure_exists=ensure_exists,
-    ).site_config_dir
+    )
 
 
 def user_cache_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -176,14 +203,15 @@ def user_cache_dir(  # ruff:ignore[too-many-arguments, too-many-positional-argum
     :returns: cache directory tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "user_cache_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_cache_dir
+    )
 
 
 def site_cache_dir(
@@ -202,13 +230,14 @@ def site_cache_dir(
     :returns: cache directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_cache_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
-    ).site_cache_dir
+    )
 
 
 def user_state_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -229,14 +258,15 @@ def user_state_dir(  # ruff:ignore[too-many-arguments, too-many-positional-argum
     :returns: state directory tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "user_state_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         roaming=roaming,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_state_dir
+    )
 
 
 def site_state_dir(
@@ -253,12 +283,13 @@ def site_state_dir(
     :returns: state directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_state_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         ensure_exists=ensure_exists,
-    ).site_state_dir
+    )
 
 
 def user_log_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -279,14 +310,15 @@ def user_log_dir(  # ruff:ignore[too-many-arguments, too-many-positional-argumen
     :returns: log directory tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "user_log_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_log_dir
+    )
 
 
 def site_log_dir(
@@ -305,83 +337,84 @@ def site_log_dir(
     :returns: log directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_log_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
-    ).site_log_dir
+    )
 
 
 def user_documents_dir() -> str:
     """:returns: documents directory tied to the user"""
-    return PlatformDirs().user_documents_dir
+    return _scoped_dir("user_documents_dir")
 
 
 def user_downloads_dir() -> str:
     """:returns: downloads directory tied to the user"""
-    return PlatformDirs().user_downloads_dir
+    return _scoped_dir("user_downloads_dir")
 
 
 def user_pictures_dir() -> str:
     """:returns: pictures directory tied to the user"""
-    return PlatformDirs().user_pictures_dir
+    return _scoped_dir("user_pictures_dir")
 
 
 def user_videos_dir() -> str:
     """:returns: videos directory tied to the user"""
-    return PlatformDirs().user_videos_dir
+    return _scoped_dir("user_videos_dir")
 
 
 def user_music_dir() -> str:
     """:returns: music directory tied to the user"""
-    return PlatformDirs().user_music_dir
+    return _scoped_dir("user_music_dir")
 
 
 def user_desktop_dir() -> str:
     """:returns: desktop directory tied to the user"""
-    return PlatformDirs().user_desktop_dir
+    return _scoped_dir("user_desktop_dir")
 
 
 def user_projects_dir() -> str:
     """:returns: projects directory tied to the user"""
-    return PlatformDirs().user_projects_dir
+    return _scoped_dir("user_projects_dir")
 
 
 def user_publicshare_dir() -> str:
     """:returns: public share directory tied to the user"""
-    return PlatformDirs().user_publicshare_dir
+    return _scoped_dir("user_publicshare_dir")
 
 
 def user_templates_dir() -> str:
     """:returns: templates directory tied to the user"""
-    return PlatformDirs().user_templates_dir
+    return _scoped_dir("user_templates_dir")
 
 
 def user_fonts_dir() -> str:
     """:returns: fonts directory tied to the user"""
-    return PlatformDirs().user_fonts_dir
+    return _scoped_dir("user_fonts_dir")
 
 
 def user_preference_dir() -> str:
     """:returns: preference directory tied to the user"""
-    return PlatformDirs().user_preference_dir
+    return _scoped_dir("user_preference_dir")
 
 
 def user_bin_dir() -> str:
     """:returns: bin directory tied to the user"""
-    return PlatformDirs().user_bin_dir
+    return _scoped_dir("user_bin_dir")
 
 
 def site_bin_dir() -> str:
     """:returns: bin directory shared by users"""
-    return PlatformDirs().site_bin_dir
+    return _scoped_dir("site_bin_dir")
 
 
 def user_applications_dir() -> str:
     """:returns: applications directory tied to the user"""
-    return PlatformDirs().user_applications_dir
+    return _scoped_dir("user_applications_dir")
 
 
 def site_applications_dir(
@@ -394,10 +427,11 @@ def site_applications_dir(
     :returns: applications directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_applications_dir",
         multipath=multipath,
         ensure_exists=ensure_exists,
-    ).site_applications_dir
+    )
 
 
 def user_runtime_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -418,14 +452,15 @@ def user_runtime_dir(  # ruff:ignore[too-many-arguments, too-many-positional-arg
     :returns: runtime directory tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "user_runtime_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_runtime_dir
+    )
 
 
 def site_runtime_dir(
@@ -444,13 +479,14 @@ def site_runtime_dir(
     :returns: runtime directory shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_dir(
+        "site_runtime_dir",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
-    ).site_runtime_dir
+    )
 
 
 def user_data_path(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -471,14 +507,15 @@ def user_data_path(  # ruff:ignore[too-many-arguments, too-many-positional-argum
     :returns: data path tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "user_data_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         roaming=roaming,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_data_path
+    )
 
 
 def site_data_path(
@@ -497,13 +534,14 @@ def site_data_path(
     :returns: data path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_data_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         multipath=multipath,
         ensure_exists=ensure_exists,
-    ).site_data_path
+    )
 
 
 def user_config_path(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -524,14 +562,15 @@ def user_config_path(  # ruff:ignore[too-many-arguments, too-many-positional-arg
     :returns: config path tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "user_config_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         roaming=roaming,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_config_path
+    )
 
 
 def site_config_path(
@@ -550,13 +589,14 @@ def site_config_path(
     :returns: config path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_config_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         multipath=multipath,
         ensure_exists=ensure_exists,
-    ).site_config_path
+    )
 
 
 def site_cache_path(
@@ -575,13 +615,14 @@ def site_cache_path(
     :returns: cache path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_cache_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
-    ).site_cache_path
+    )
 
 
 def user_cache_path(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -602,14 +643,15 @@ def user_cache_path(  # ruff:ignore[too-many-arguments, too-many-positional-argu
     :returns: cache path tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "user_cache_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_cache_path
+    )
 
 
 def user_state_path(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -630,14 +672,15 @@ def user_state_path(  # ruff:ignore[too-many-arguments, too-many-positional-argu
     :returns: state path tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "user_state_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         roaming=roaming,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_state_path
+    )
 
 
 def site_state_path(
@@ -654,12 +697,13 @@ def site_state_path(
     :returns: state path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_state_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         ensure_exists=ensure_exists,
-    ).site_state_path
+    )
 
 
 def user_log_path(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -680,14 +724,15 @@ def user_log_path(  # ruff:ignore[too-many-arguments, too-many-positional-argume
     :returns: log path tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "user_log_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_log_path
+    )
 
 
 def site_log_path(
@@ -706,83 +751,84 @@ def site_log_path(
     :returns: log path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_log_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
-    ).site_log_path
+    )
 
 
 def user_documents_path() -> Path:
     """:returns: documents path tied to the user"""
-    return PlatformDirs().user_documents_path
+    return _scoped_path("user_documents_path")
 
 
 def user_downloads_path() -> Path:
     """:returns: downloads path tied to the user"""
-    return PlatformDirs().user_downloads_path
+    return _scoped_path("user_downloads_path")
 
 
 def user_pictures_path() -> Path:
     """:returns: pictures path tied to the user"""
-    return PlatformDirs().user_pictures_path
+    return _scoped_path("user_pictures_path")
 
 
 def user_videos_path() -> Path:
     """:returns: videos path tied to the user"""
-    return PlatformDirs().user_videos_path
+    return _scoped_path("user_videos_path")
 
 
 def user_music_path() -> Path:
     """:returns: music path tied to the user"""
-    return PlatformDirs().user_music_path
+    return _scoped_path("user_music_path")
 
 
 def user_desktop_path() -> Path:
     """:returns: desktop path tied to the user"""
-    return PlatformDirs().user_desktop_path
+    return _scoped_path("user_desktop_path")
 
 
 def user_projects_path() -> Path:
     """:returns: projects path tied to the user"""
-    return PlatformDirs().user_projects_path
+    return _scoped_path("user_projects_path")
 
 
 def user_publicshare_path() -> Path:
     """:returns: public share path tied to the user"""
-    return PlatformDirs().user_publicshare_path
+    return _scoped_path("user_publicshare_path")
 
 
 def user_templates_path() -> Path:
     """:returns: templates path tied to the user"""
-    return PlatformDirs().user_templates_path
+    return _scoped_path("user_templates_path")
 
 
 def user_fonts_path() -> Path:
     """:returns: fonts path tied to the user"""
-    return PlatformDirs().user_fonts_path
+    return _scoped_path("user_fonts_path")
 
 
 def user_preference_path() -> Path:
     """:returns: preference path tied to the user"""
-    return PlatformDirs().user_preference_path
+    return _scoped_path("user_preference_path")
 
 
 def user_bin_path() -> Path:
     """:returns: bin path tied to the user"""
-    return PlatformDirs().user_bin_path
+    return _scoped_path("user_bin_path")
 
 
 def site_bin_path() -> Path:
     """:returns: bin path shared by users"""
-    return PlatformDirs().site_bin_path
+    return _scoped_path("site_bin_path")
 
 
 def user_applications_path() -> Path:
     """:returns: applications path tied to the user"""
-    return PlatformDirs().user_applications_path
+    return _scoped_path("user_applications_path")
 
 
 def site_applications_path(
@@ -795,10 +841,11 @@ def site_applications_path(
     :returns: applications path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_applications_path",
         multipath=multipath,
         ensure_exists=ensure_exists,
-    ).site_applications_path
+    )
 
 
 def user_runtime_path(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
@@ -819,14 +866,15 @@ def user_runtime_path(  # ruff:ignore[too-many-arguments, too-many-positional-ar
     :returns: runtime path tied to the user
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "user_runtime_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
         use_site_for_root=use_site_for_root,
-    ).user_runtime_path
+    )
 
 
 def site_runtime_path(
@@ -845,21 +893,34 @@ def site_runtime_path(
     :returns: runtime path shared by users
 
     """
-    return PlatformDirs(
+    return _scoped_path(
+        "site_runtime_path",
         appname=appname,
         appauthor=appauthor,
         version=version,
         opinion=opinion,
         ensure_exists=ensure_exists,
-    ).site_runtime_path
+    )
 
 
 __all__ = [
     "AppDirs",
+    "ChildDirs",
+    "DirKind",
+    "DirPath",
+    "DirPaths",
+    "DirsConfig",
+    "Layout",
+    "LayoutDir",
     "PlatformDirs",
     "PlatformDirsABC",
+    "PlatformDirsFactory",
+    "Provisioned",
+    "Scope",
     "__version__",
     "__version_info__",
+    "provision",
+    "scoped",
     "site_applications_dir",
     "site_applications_path",
     "site_bin_dir",
@@ -914,4 +975,5 @@ __all__ = [
     "user_templates_path",
     "user_videos_dir",
     "user_videos_path",
+    "warmup",
 ]
@@ -44,23 +44,27 @@ def main() -> None:
 
     print("-- app dirs (with optional 'version')")  # ruff:ignore[print]
     dirs = PlatformDirs(app_name, app_author, version="1.0")
+    resolved = dirs.resolve_all()
     for prop in PROPS:
-        print(f"{prop}: {getattr(dirs, prop)}")  # ruff:ignore[print]
+        print(f"{prop}: {resolved[prop]}")  # ruff:ignore[print]
 
     print("\n-- app dirs (without optional 'version')")  # ruff:ignore[print]
     dirs = PlatformDirs(app_name, app_author)
+    resolved = dirs.resolve_all()
     for prop in PROPS:
-        print(f"{prop}: {getattr(dirs, prop)}")  # ruff:ignore[print]
+        print(f"{prop}: {resolved[prop]}")  # ruff:ignore[print]
 
     print("\n-- app dirs (without optional 'appauthor')")  # ruff:ignore[print]
     dirs = PlatformDirs(app_name)
+    resolved = dirs.resolve_all()
     for prop in PROPS:
-        print(f"{prop}: {getattr(dirs, prop)}")  # ruff:ignore[print]
+        print(f"{prop}: {resolved[prop]}")  # ruff:ignore[print]
 
     print("\n-- app dirs (with disabled 'appauthor')")  # ruff:ignore[print]
     dirs = PlatformDirs(app_name, appauthor=False)
+    resolved = dirs.resolve_all()
     for prop in PROPS:
-        print(f"{prop}: {getattr(dirs, prop)}")  # ruff:ignore[print]
+        print(f"{prop}: {resolved[prop]}")  # ruff:ignore[print]
 
 
 if __name__ == "__main__":
@@ -5,10 +5,9 @@ from __future__ import annotations
 import os
 import re
 import sys
-from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
-from .api import PlatformDirsABC
+from .api import PlatformDirsABC, _clear_at_fork, _join, _shared_cache
 
 
 class Android(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
@@ -68,7 +67,7 @@ class Android(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         """Log directory tied to the user, same as `user_cache_dir` if not opinionated else ``log`` in it, e.g. ``/data/user/<userid>/<packagename>/cache/<AppName>/log``."""
         path = self.user_cache_dir
         if self.opinion:
-            path = os.path.join(path, "log")  # ruff:ignore[os-path-join]
+            path = _join(path, "log")
             self._optionally_create_directory(path)
         return path
 
@@ -157,7 +156,7 @@ class Android(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         """Runtime directory tied to the user, same as `user_cache_dir` if not opinionated else ``tmp`` in it, e.g. ``/data/user/<userid>/<packagename>/cache/<AppName>/tmp``."""
         path = self.user_cache_dir
         if self.opinion:
-            path = os.path.join(path, "tmp")  # ruff:ignore[os-path-join]
+            path = _join(path, "tmp")
             self._optionally_create_directory(path)
         return path
 
@@ -167,7 +166,8 @@ class Android(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         return self.user_runtime_dir
 
 
-@lru_cache(maxsize=1)
+@_clear_at_fork
+@_shared_cache(maxsize=1)
 def _android_folder() -> str | None:  # ruff:ignore[complex-structure]
     """:returns: base folder for the Android OS or None if it cannot be found"""
     result: str | None = None
@@ -215,7 +215,8 @@ def _android_folder() -> str | None:  # ruff:ignore[complex-structure]
     return result
 
 
-@lru_cache(maxsize=1)
+@_clear_at_fork
+@_shared_cache(maxsize=1)
 def _android_documents_folder() -> str:
     """:returns: documents folder for the Android OS"""
     # Get directories with pyjnius
@@ -231,7 +232,8 @@ def _android_documents_folder() -> str:
     return documents_dir
 
 
-@lru_cache(maxsize=1)
+@_clear_at_fork
+@_shared_cache(maxsize=1)
 def _android_downloads_folder() -> str:
     """:returns: downloads folder for the Android OS"""
     # Get directories with pyjnius
@@ -247,7 +249,8 @@ def _android_downloads_folder() -> str:
     return downloads_dir
 
 
-@lru_cache(maxsize=1)
+@_clear_at_fork
+@_shared_cache(maxsize=1)
 def _android_pictures_folder() -> str:
     """:returns: pictures folder for the Android OS"""
     # Get directories with pyjnius
@@ -263,7 +266,8 @@ def _android_pictures_folder() -> str:
     return pictures_dir
 
 
-@lru_cache(maxsize=1)
+@_clear_at_fork
+@_shared_cache(maxsize=1)
 def _android_videos_folder() -> str:
     """:returns: videos folder for the Android OS"""
     # Get directories with pyjnius
@@ -279,7 +283,8 @@ def _android_videos_folder() -> str:
     return videos_dir
 
 
-@lru_cache(maxsize=1)
+@_clear_at_fork
+@_shared_cache(maxsize=1)
 def _android_music_folder() -> str:
     """:returns: music folder for the Android OS"""
     # Get directories with pyjnius
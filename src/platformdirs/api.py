@@ -3,13 +3,89 @@
 from __future__ import annotations
 
 import os
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from contextlib import suppress
+from copy import copy
+from enum import Enum
+from functools import cached_property, lru_cache, update_wrapper
+from operator import attrgetter, methodcaller
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar, cast, overload
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-    from typing import Literal
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+    from typing import Any, Literal, Protocol
+
+    _T_co = TypeVar("_T_co", covariant=True)
+
+    class _Cached(Protocol[_T_co]):
+        def __call__(self, *args: Hashable) -> _T_co: ...
+        def cache_clear(self) -> None: ...
+
+    _CacheT = TypeVar("_CacheT", bound=_Cached[Any])
+
+_T = TypeVar("_T")
+
+#: Environment variables :func:`os.path.expanduser` reads to find the home directory on this platform.
+_HOME_ENV_VARS = ("USERPROFILE", "HOMEDRIVE", "HOMEPATH") if os.name == "nt" else ("HOME",)
+
+#: Environment variables :meth:`PlatformDirsABC.fingerprint` tracks, besides those starting with a prefix below.
+_FINGERPRINT_VARS = frozenset({
+    "HOME",
+    *_HOME_ENV_VARS,
+    "APPDATA",
+    "LOCALAPPDATA",
+    "ALLUSERSPROFILE",
+    "PROGRAMDATA",
+    "PUBLIC",
+})
+_FINGERPRINT_PREFIXES = ("XDG_", "WIN_PD_OVERRIDE_", "ANDROID_")
+
+#: Characters that end the ``~`` or ``~name`` prefix :func:`os.path.expanduser` replaces.
+_SEPARATORS = "\\/" if os.name == "nt" else "/"
+
+#: Whether threads run in parallel, see :func:`_shared_cache`.
+_FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+#: Characters that make :func:`os.path.join` do more than insert a separator when they end a base or start a suffix.
+_JOIN_SPECIAL = "\\/:" if os.name == "nt" else "/"
+
+
+class DirKind(str, Enum):
+    """Kind of directory, as accepted by :meth:`PlatformDirsABC.get`; members compare equal to their string value."""
+
+    __str__ = str.__str__
+
+    DATA = "data"
+    CONFIG = "config"
+    CACHE = "cache"
+    STATE = "state"
+    LOG = "log"
+    RUNTIME = "runtime"
+    APPLICATIONS = "applications"
+    BIN = "bin"
+    DOCUMENTS = "documents"
+    DOWNLOADS = "downloads"
+    PICTURES = "pictures"
+    VIDEOS = "videos"
+    MUSIC = "music"
+    DESKTOP = "desktop"
+    PROJECTS = "projects"
+    PUBLICSHARE = "publicshare"
+    TEMPLATES = "templates"
+    FONTS = "fonts"
+    PREFERENCE = "preference"
+
+
+class Scope(str, Enum):
+    """Whether a directory is tied to the user or shared by users; members compare equal to their string value."""
+
+    __str__ = str.__str__
+
+    USER = "user"
+    SITE = "site"
 
 
 class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
@@ -21,6 +97,13 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
 
     """
 
+    #: Where environment variables are read from, see `env`; :meth:`resolve_all` swaps in a view reading each one once.
+    _env: Mapping[str, str] = os.environ
+
+    #: The user id directories are resolved for, ``None`` for the user the process runs as, see
+    #: :meth:`Unix.for_user <platformdirs.unix.Unix.for_user>`.
+    _user_id: int | None = None
+
     def __init__(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
         self,
         appname: str | None = None,
@@ -31,6 +114,8 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
         opinion: bool = True,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
         ensure_exists: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
         use_site_for_root: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        *,
+        env: Mapping[str, str] | None = None,
     ) -> None:
         """Create a new platform directory.
 
@@ -42,8 +127,11 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
         :param opinion: See `opinion`.
         :param ensure_exists: See `ensure_exists`.
         :param use_site_for_root: See `use_site_for_root`.
+        :param env: See `env`.
 
         """
+        if env is not None and env is not os.environ:
+            self._env = env
         self.appname = appname  #: The name of the application.
         self.appauthor = appauthor
         """The name of the app author or distributing body for this application.
@@ -100,26 +188,117 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
 
         """
 
+    @property
+    def env(self) -> Mapping[str, str]:
+        """The environment variables directories are resolved against, :data:`os.environ` unless given.
+
+        Pass a snapshot, e.g. ``env=dict(os.environ)``, to keep resolution stable while the process environment
+        changes, or a worker's environment to compute its directories without touching :data:`os.environ`. The home
+        directory comes from the mapping too (``HOME``, or ``USERPROFILE`` on Windows), whereas known folders the
+        Windows shell reports and the user id Unix checks for `use_site_for_root` still come from the process.
+
+        """
+        return self._env
+
+    @property
+    def _config(self) -> tuple[object, ...]:
+        """The platform class and every constructor parameter, which together decide what the instance resolves to."""
+        return (
+            type(self),
+            self.appname,
+            self.appauthor,
+            self.version,
+            self.roaming,
+            self.multipath,
+            self.opinion,
+            self.ensure_exists,
+            self.use_site_for_root,
+        )
+
+    def config(self) -> DirsConfig:
+        """Snapshot the configuration as a hashable value, e.g. to key a dict or a :func:`functools.lru_cache` on.
+
+        Instances compare and hash by identity, as their attributes may change at any time; the snapshot does not
+        follow such changes. A given `env` is copied into it, whereas the process environment is recorded as ``None``.
+
+        :returns: the platform class, every constructor parameter, `env` and the user resolved for
+
+        """
+        env = None if self._env is os.environ else frozenset(self._env.items())
+        return DirsConfig(*self._config, env, self._user_id)
+
+    def __repr__(self) -> str:
+        """:returns: the constructor call that creates an instance configured alike, bar a given `env`
+
+        A given `env` shows only as its number of variables, as it may hold credentials that must not reach logs.
+        Instances resolving for another user show as the :meth:`~platformdirs.unix.Unix.for_user` call with their id.
+
+        """
+        _, *values = self._config
+        params = ", ".join(f"{name}={value!r}" for name, value in zip(_CONFIG_PARAMS, values, strict=True))
+        if self._env is not os.environ:
+            params = f"{params}, env=<{len(self._env)} variables>"
+        if self._user_id is not None:
+            return f"{type(self).__name__}.for_user({self._user_id}, {params})"
+        return f"{type(self).__name__}({params})"
+
+    def __reduce__(self) -> tuple[Callable[..., PlatformDirsABC], tuple[object, ...], dict[str, object] | None]:
+        """Pickle as the constructor arguments plus whatever else the instance holds that is valid in another process.
+
+        Trailing arguments left at their default are omitted. Of the private attributes only those in
+        :data:`_PICKLED_STATE` travel along, e.g. `unique_dirs` results so the unpickled copy starts warm; other caches,
+        such as what `refresh` resolved, are rebuilt wherever the copy lands, as is whether the process runs as root.
+        Public attributes of subclasses travel along, and so does a given `env`; otherwise the unpickled copy reads the
+        environment of the process it lands in.
+
+        """
+        args = self._config[1:]
+        while args and args[-1] is _CONFIG_DEFAULTS[len(args) - 1]:
+            args = args[:-1]
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if (name in _PICKLED_STATE or not name.startswith("_")) and name not in _CONFIG_PARAMS and value != {}
+        }
+        return _unpickle, (type(self), args), state or None
+
+    def __copy__(self) -> PlatformDirsABC:
+        """Shallow copy that keeps every cached value, unlike pickling."""
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    @cached_property
+    def _suffixes(self) -> dict[tuple[object, ...], str]:
+        """Suffixes appended to base directories, keyed on the attributes they are built from, so a change compiles anew."""
+        return {}
+
+    def _app_suffix(self) -> str:
+        key = (self.appname, self.version)
+        if (suffix := self._suffixes.get(key)) is None:
+            if not self.appname:
+                parts: tuple[str, ...] = ()
+            else:
+                parts = (self.appname, self.version) if self.version else (self.appname,)
+            suffix = self._suffixes[key] = _compile_suffix(parts)
+        return suffix
+
     def _append_app_name_and_version(self, *base: str) -> str:
-        params = list(base[1:])
-        if self.appname:
-            params.append(self.appname)
-            if self.version:
-                params.append(self.version)
-        path = os.path.join(base[0], *params)  # ruff:ignore[os-path-join]
+        path = os.path.join(*base) if len(base) > 1 else base[0]  # ruff:ignore[os-path-join]
+        path = _join(path, self._app_suffix())
         self._optionally_create_directory(path)
         return path
 
+    def _append_app_name_and_version_all(self, bases: tuple[str, ...]) -> tuple[str, ...]:
+        paths = _join_all(bases, self._app_suffix())
+        for path in paths:
+            self._optionally_create_directory(path)
+        return paths
+
     def _optionally_create_directory(self, path: str) -> None:
         if self.ensure_exists:
             Path(path).mkdir(parents=True, exist_ok=True)
 
-    def _first_item_as_path_if_multipath(self, directory: str) -> Path:
-        if self.multipath:
-            # If multipath is True, the first path is returned.
-            directory = directory.partition(os.pathsep)[0]
-        return Path(directory)
-
     @property
     @abstractmethod
     def user_data_dir(self) -> str:
@@ -131,7 +310,12 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
         """Data directory shared by users."""
 
     @property
-    def _site_data_dirs(self) -> list[str]:
+    def site_data_dirs(self) -> tuple[str, ...]:
+        """Data directories shared by users, most preferred first, regardless of `multipath`."""
+        return (self.site_data_dir,)
+
+    @property
+    def _site_data_dirs(self) -> tuple[str, ...]:
         raise NotImplementedError
 
     @property
@@ -145,7 +329,12 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
         """Config directory shared by users."""
 
     @property
-    def _site_config_dirs(self) -> list[str]:
+    def site_config_dirs(self) -> tuple[str, ...]:
+        """Config directories shared by users, most preferred first, regardless of `multipath`."""
+        return (self.site_config_dir,)
+
+    @property
+    def _site_config_dirs(self) -> tuple[str, ...]:
         raise NotImplementedError
 
     @property
@@ -158,6 +347,11 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
     def site_cache_dir(self) -> str:
         """Cache directory shared by users."""
 
+    @property
+    def site_cache_dirs(self) -> tuple[str, ...]:
+        """Cache directories shared by users, most preferred first, regardless of `multipath`."""
+        return (self.site_cache_dir,)
+
     @property
     @abstractmethod
     def user_state_dir(self) -> str:
@@ -254,7 +448,12 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
         """Applications directory shared by users."""
 
     @property
-    def _site_applications_dirs(self) -> list[str]:
+    def site_applications_dirs(self) -> tuple[str, ...]:
+        """Applications directories shared by users, most preferred first, regardless of `multipath`."""
+        return (self.site_applications_dir,)
+
+    @property
+    def _site_applications_dirs(self) -> tuple[str, ...]:
         raise NotImplementedError
 
     @property
@@ -270,137 +469,322 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_data_path(self) -> Path:
         """Data path tied to the user."""
-        return Path(self.user_data_dir)
+        return _as_path(self.user_data_dir)
 
     @property
     def site_data_path(self) -> Path:
         """Data path shared by users."""
-        return Path(self.site_data_dir)
+        return _as_path(self.site_data_dir)
+
+    @property
+    def site_data_paths(self) -> tuple[Path, ...]:
+        """Data paths shared by users, most preferred first, regardless of `multipath`."""
+        return _as_paths(self.site_data_dirs)
 
     @property
     def user_config_path(self) -> Path:
         """Config path tied to the user."""
-        return Path(self.user_config_dir)
+        return _as_path(self.user_config_dir)
 
     @property
     def site_config_path(self) -> Path:
         """Config path shared by users."""
-        return Path(self.site_config_dir)
+        return _as_path(self.site_config_dir)
+
+    @property
+    def site_config_paths(self) -> tuple[Path, ...]:
+        """Config paths shared by users, most preferred first, regardless of `multipath`."""
+        return _as_paths(self.site_config_dirs)
 
     @property
     def user_cache_path(self) -> Path:
         """Cache path tied to the user."""
-        return Path(self.user_cache_dir)
+        return _as_path(self.user_cache_dir)
 
     @property
     def site_cache_path(self) -> Path:
         """Cache path shared by users."""
-        return Path(self.site_cache_dir)
+        return _as_path(self.site_cache_dir)
+
+    @property
+    def site_cache_paths(self) -> tuple[Path, ...]:
+        """Cache paths shared by users, most preferred first, regardless of `multipath`."""
+        return _as_paths(self.site_cache_dirs)
 
     @property
     def user_state_path(self) -> Path:
         """State path tied to the user."""
-        return Path(self.user_state_dir)
+        return _as_path(self.user_state_dir)
 
     @property
     def site_state_path(self) -> Path:
         """State path shared by users."""
-        return Path(self.site_state_dir)
+        return _as_path(self.site_state_dir)
 
     @property
     def user_log_path(self) -> Path:
         """Log path tied to the user."""
-        return Path(self.user_log_dir)
+        return _as_path(self.user_log_dir)
 
     @property
     def site_log_path(self) -> Path:
         """Log path shared by users."""
-        return Path(self.site_log_dir)
+        return _as_path(self.site_log_dir)
 
     @property
     def user_documents_path(self) -> Path:
         """Documents path tied to the user."""
-        return Path(self.user_documents_dir)
+        return _as_path(self.user_documents_dir)
 
     @property
     def user_downloads_path(self) -> Path:
         """Downloads path tied to the user."""
-        return Path(self.user_downloads_dir)
+        return _as_path(self.user_downloads_dir)
 
     @property
     def user_pictures_path(self) -> Path:
         """Pictures path tied to the user."""
-        return Path(self.user_pictures_dir)
+        return _as_path(self.user_pictures_dir)
 
     @property
     def user_videos_path(self) -> Path:
         """Videos path tied to the user."""
-        return Path(self.user_videos_dir)
+        return _as_path(self.user_videos_dir)
 
     @property
     def user_music_path(self) -> Path:
         """Music path tied to the user."""
-        return Path(self.user_music_dir)
+        return _as_path(self.user_music_dir)
 
     @property
     def user_desktop_path(self) -> Path:
         """Desktop path tied to the user."""
-        return Path(self.user_desktop_dir)
+        return _as_path(self.user_desktop_dir)
 
     @property
     def user_projects_path(self) -> Path:
         """Projects path tied to the user."""
-        return Path(self.user_projects_dir)
+        return _as_path(self.user_projects_dir)
 
     @property
     def user_publicshare_path(self) -> Path:
         """Public share path tied to the user."""
-        return Path(self.user_publicshare_dir)
+        return _as_path(self.user_publicshare_dir)
 
     @property
     def user_templates_path(self) -> Path:
         """Templates path tied to the user."""
-        return Path(self.user_templates_dir)
+        return _as_path(self.user_templates_dir)
 
     @property
     def user_fonts_path(self) -> Path:
         """Fonts path tied to the user."""
-        return Path(self.user_fonts_dir)
+        return _as_path(self.user_fonts_dir)
 
     @property
     def user_preference_path(self) -> Path:
         """Preference path tied to the user."""
-        return Path(self.user_preference_dir)
+        return _as_path(self.user_preference_dir)
 
     @property
     def user_bin_path(self) -> Path:
         """Bin path tied to the user."""
-        return Path(self.user_bin_dir)
+        return _as_path(self.user_bin_dir)
 
     @property
     def site_bin_path(self) -> Path:
         """Bin path shared by users."""
-        return Path(self.site_bin_dir)
+        return _as_path(self.site_bin_dir)
 
     @property
     def user_applications_path(self) -> Path:
         """Applications path tied to the user."""
-        return Path(self.user_applications_dir)
+        return _as_path(self.user_applications_dir)
 
     @property
     def site_applications_path(self) -> Path:
         """Applications path shared by users."""
-        return Path(self.site_applications_dir)
+        return _as_path(self.site_applications_dir)
+
+    @property
+    def site_applications_paths(self) -> tuple[Path, ...]:
+        """Applications paths shared by users, most preferred first, regardless of `multipath`."""
+        return _as_paths(self.site_applications_dirs)
 
     @property
     def user_runtime_path(self) -> Path:
         """Runtime path tied to the user."""
-        return Path(self.user_runtime_dir)
+        return _as_path(self.user_runtime_dir)
 
     @property
     def site_runtime_path(self) -> Path:
         """Runtime path shared by users."""
-        return Path(self.site_runtime_dir)
+        return _as_path(self.site_runtime_dir)
+
+    @overload
+    def get(self, kind: DirKind | str, scope: Scope | str = ..., *, as_path: Literal[False] = ...) -> str: ...
+    @overload
+    def get(self, kind: DirKind | str, scope: Scope | str = ..., *, as_path: Literal[True]) -> Path: ...
+    def get(self, kind: DirKind | str, scope: Scope | str = Scope.USER, *, as_path: bool = False) -> str | Path:
+        """Look up a directory by kind and scope, e.g. ``get(DirKind.CACHE)`` is `user_cache_dir`.
+
+        Plain strings work too, so ``get("log", "site", as_path=True)`` is `site_log_path`.
+
+        :param kind: the kind of directory.
+        :param scope: whether the directory is tied to the user or shared by users.
+        :param as_path: return a :class:`~pathlib.Path` rather than a :class:`str`.
+        :raises ValueError: if there is no such directory, e.g. a shared documents directory.
+
+        """
+        try:
+            get_dir, get_path = _DISPATCH[kind, scope]
+        except KeyError:
+            msg = f"no {scope} {kind} directory"
+            raise ValueError(msg) from None
+        return get_path(self) if as_path else get_dir(self)
+
+    def _locations(self, kind: DirKind | str, scope: Scope | str) -> tuple[str, ...]:
+        """:returns: every location of a directory, several only for shared ones listed in full through `multipath`"""
+        if scope == Scope.SITE and self.multipath and (get_dirs := _SITE_DIRS.get(kind)) is not None:
+            return get_dirs(self)
+        return (self.get(kind, scope),)
+
+    async def aensure(self, *kinds: DirKind | str, scope: Scope | str = Scope.USER) -> list[Path]:
+        """Create directories without blocking the event loop, e.g. ``await dirs.aensure("cache", "log")``.
+
+        Paths resolve on the loop, which reads the environment and in-memory caches only; every ``mkdir`` then runs in
+        a worker thread through :func:`asyncio.to_thread`, all at once, so a slow file system such as an NFS-mounted
+        home stalls no other task. Leave `ensure_exists` off and call this once at startup: property reads then create
+        nothing. Shared directories are created at every location when `multipath` is set.
+
+        :param kinds: the kinds of directory to create.
+        :param scope: whether the directories are tied to the user or shared by users.
+        :returns: the directories as :class:`~pathlib.Path` objects, in the order of ``kinds``
+        :raises ValueError: if there is no such directory, e.g. a shared documents directory.
+
+        """
+        import asyncio  # ruff:ignore[import-outside-top-level]  # slow to import and only needed here
+
+        resolver = self
+        if self.ensure_exists:
+            resolver = copy(self)
+            resolver.ensure_exists = False
+        targets = dict.fromkeys(path for kind in kinds for path in resolver._locations(kind, scope))  # ruff:ignore[private-member-access]
+        await asyncio.gather(*(asyncio.to_thread(Path(path).mkdir, parents=True, exist_ok=True) for path in targets))
+        return [resolver.get(kind, scope, as_path=True) for kind in kinds]
+
+    def child(self, name: str, *, ensure_exists: bool | None = None) -> ChildDirs:
+        """Directories one segment further down, e.g. a plugin's own cache, data and config directories.
+
+        :param name: the path segment appended to each directory.
+        :param ensure_exists: create directories on first access, defaults to `ensure_exists`.
+        :returns: a view that resolves nothing until accessed, see :class:`ChildDirs`
+
+        """
+        return ChildDirs(self, name, ensure_exists=self.ensure_exists if ensure_exists is None else ensure_exists)
+
+    @property
+    def dirpaths(self) -> DirPaths:
+        """View of this instance whose ``*_dir`` attributes are :class:`DirPath` strings, see :class:`DirPaths`."""
+        return DirPaths(self)
+
+    def resolve_all(self) -> dict[str, str]:
+        """Resolve every directory in one pass, e.g. to print or serialize them all.
+
+        Environment variables, the home directory and files such as ``user-dirs.dirs`` are read once for the whole pass
+        instead of once per directory. Nothing is created, even with `ensure_exists` set.
+
+        :returns: every ``*_dir`` property, keyed on its name
+
+        """
+        return self._resolve(_DIR_GETTERS)[0]
+
+    def _resolve(
+        self, getters: Iterable[tuple[str, Callable[[PlatformDirsABC], str]]]
+    ) -> tuple[dict[str, str], dict[str, frozenset[str]]]:
+        """:returns: the directories of ``getters`` resolved in one pass, and the variables each one read"""
+        resolver = copy(self)
+        resolver.ensure_exists = False  # only report the paths, the properties still create them
+        env = resolver._env = _ResolutionEnv(self._env)  # ruff:ignore[private-member-access]
+        resolved, dependencies = {}, {}
+        for name, get_dir in getters:
+            env.reads = set()
+            resolved[name] = get_dir(resolver)
+            dependencies[name] = frozenset(env.reads)
+        return resolved, dependencies
+
+    def fingerprint(self) -> tuple[object, ...]:
+        """Summarize every input resolution depends on besides the constructor arguments, cheaply.
+
+        That is the home directory, ``XDG_*``, ``WIN_PD_OVERRIDE_*`` and ``ANDROID_*`` variables along with the Windows
+        folder fallbacks, read from `env`, plus the user id, :data:`sys.prefix` and the modification stamp of files read
+        during resolution, such as ``user-dirs.dirs``. Two equal fingerprints of the same instance resolve to the same
+        directories, so a value derived from them can be cached keyed on it. Whether ``/run/user/$uid`` is writable is
+        not part of it.
+
+        :returns: a hashable value that changes whenever any input changes
+
+        """
+        variables, others = self._inputs()
+        return frozenset(variables.items()), *others
+
+    def _inputs(self) -> tuple[dict[str, str], tuple[object, ...]]:
+        """:returns: the variables `fingerprint` tracks, and every other input it tracks"""
+        env = self._env
+        variables = {
+            name: env[name] for name in env if name in _FINGERPRINT_VARS or name.startswith(_FINGERPRINT_PREFIXES)
+        }
+        return variables, (_uid(), sys.prefix, tuple(map(_stat_stamp, self._input_files(variables))))
+
+    def _input_files(self, env: Mapping[str, str]) -> tuple[str, ...]:  # ruff:ignore[no-self-use, unused-method-argument]
+        """:returns: the files resolution reads, located through the fingerprinted variables ``env``"""
+        return ()
+
+    def refresh(self) -> dict[str, str]:
+        """Resolve every directory like :meth:`resolve_all`, but only again once `fingerprint` or an attribute changed.
+
+        Meant for long-lived processes that poll for changes, e.g. once per request: an unchanged environment costs a
+        fingerprint rather than a full resolution. Changing an attribute such as `appname` resolves everything again.
+        When only environment variables changed, only the directories that read one of them are resolved again, see
+        `env_dependencies`.
+
+        :returns: every ``*_dir`` property, keyed on its name
+
+        """
+        return dict(self._refreshed().dirs)
+
+    def env_dependencies(self) -> dict[str, frozenset[str]]:
+        """Report the environment variables each directory was resolved from, e.g. to build exact cache keys.
+
+        The graph is recorded while resolving, so it names the variables actually read: on Unix ``user_cache_dir``
+        depends on ``XDG_CACHE_HOME`` alone while that is set, and on ``XDG_CACHE_HOME`` and ``HOME`` otherwise. As
+        long as those variables keep their values, along with the other inputs of `fingerprint`, the directory does
+        not change. Like `refresh`, the graph is only recorded again once the fingerprint changed.
+
+        :returns: the variable names read for each ``*_dir`` property, keyed on its name
+
+        """
+        return dict(self._refreshed().dependencies)
+
+    def _refreshed(self) -> _Resolution:
+        config = self._config
+        variables, others = self._inputs()
+        last: _Resolution | None = self.__dict__.get("_resolution")
+        if last is not None and last.config == config and last.others == others and last.variables == variables:
+            return last
+        if last is None or last.config != config or last.others != others:
+            dirs, dependencies = self._resolve(_DIR_GETTERS)
+        else:
+            changed = {
+                name
+                for name in variables.keys() | last.variables.keys()
+                if variables.get(name) != last.variables.get(name)
+            }
+            stale = [(name, get_dir) for name, get_dir in _DIR_GETTERS if last.dependencies[name] & changed]
+            dirs, dependencies = self._resolve(stale)
+            dirs, dependencies = {**last.dirs, **dirs}, {**last.dependencies, **dependencies}
+        resolution = self._resolution = _Resolution(config, variables, others, dirs, dependencies)
+        return resolution
 
     def iter_config_dirs(self) -> Iterator[str]:
         """:yield: all user and site configuration directories."""
@@ -435,29 +819,549 @@ class PlatformDirsABC(ABC):  # ruff:ignore[too-many-public-methods]
     def iter_config_paths(self) -> Iterator[Path]:
         """:yield: all user and site configuration paths."""
         for path in self.iter_config_dirs():
-            yield Path(path)
+            yield _as_path(path)
 
     def iter_data_paths(self) -> Iterator[Path]:
         """:yield: all user and site data paths."""
         for path in self.iter_data_dirs():
-            yield Path(path)
+            yield _as_path(path)
 
     def iter_cache_paths(self) -> Iterator[Path]:
         """:yield: all user and site cache paths."""
         for path in self.iter_cache_dirs():
-            yield Path(path)
+            yield _as_path(path)
 
     def iter_state_paths(self) -> Iterator[Path]:
         """:yield: all user and site state paths."""
         for path in self.iter_state_dirs():
-            yield Path(path)
+            yield _as_path(path)
 
     def iter_log_paths(self) -> Iterator[Path]:
         """:yield: all user and site log paths."""
         for path in self.iter_log_dirs():
-            yield Path(path)
+            yield _as_path(path)
 
     def iter_runtime_paths(self) -> Iterator[Path]:
         """:yield: all user and site runtime paths."""
         for path in self.iter_runtime_dirs():
-            yield Path(path)
+            yield _as_path(path)
+
+    @cached_property
+    def _unique(self) -> dict[tuple[tuple[str, ...], bool], tuple[str, ...]]:
+        """Deduplicated directory sequences, keyed on the sequence they came from so a changed one is redone."""
+        return {}
+
+    def unique_dirs(self, kind: DirKind | str, *, same_file: bool = False) -> tuple[str, ...]:
+        """User and site directories of ``kind`` like ``iter_*_dirs``, with repeated entries dropped.
+
+        Platforms often list a directory twice, e.g. Android's user and site directories are the same, and XDG lists can
+        repeat entries. The result is kept per instance and only recomputed when the underlying sequence changes.
+
+        :param kind: one of config, data, cache, state, log or runtime.
+        :param same_file: also drop directories that are the same file as an earlier one, e.g. through a symlink, by
+            comparing device and inode. Directories are checked the first time a sequence is seen, so aliases created
+            later are not detected until the sequence changes.
+        :raises ValueError: if there is no ``iter_*_dirs`` method for ``kind``.
+
+        """
+        try:
+            iter_dirs = _ITER_DIRS[kind]
+        except KeyError:
+            msg = f"no iterator for {kind} directories"
+            raise ValueError(msg) from None
+        key = (tuple(iter_dirs(self)), same_file)
+        if (unique := self._unique.get(key)) is None:
+            unique = self._unique[key] = _dedupe(key[0], same_file=same_file)
+        return unique
+
+    def unique_paths(self, kind: DirKind | str, *, same_file: bool = False) -> tuple[Path, ...]:
+        """:returns: `unique_dirs` as :class:`~pathlib.Path` objects"""
+        return _as_paths(self.unique_dirs(kind, same_file=same_file))
+
+
+class DirsConfig(NamedTuple):
+    """Frozen configuration of a :class:`PlatformDirsABC` instance, see :meth:`PlatformDirsABC.config`.
+
+    Compared and hashed by value, so memoization layers can key on it where they cannot on the mutable instance.
+
+    """
+
+    platform: type[PlatformDirsABC]  #: The platform class.
+    appname: str | None  #: See `appname <PlatformDirsABC.appname>`.
+    appauthor: str | Literal[False] | None  #: See `appauthor <PlatformDirsABC.appauthor>`.
+    version: str | None  #: See `version <PlatformDirsABC.version>`.
+    roaming: bool  #: See `roaming <PlatformDirsABC.roaming>`.
+    multipath: bool  #: See `multipath <PlatformDirsABC.multipath>`.
+    opinion: bool  #: See `opinion <PlatformDirsABC.opinion>`.
+    ensure_exists: bool  #: See `ensure_exists <PlatformDirsABC.ensure_exists>`.
+    use_site_for_root: bool  #: See `use_site_for_root <PlatformDirsABC.use_site_for_root>`.
+    env: frozenset[tuple[str, str]] | None  #: The given `env <PlatformDirsABC.env>`, ``None`` for the process's.
+    #: The user id resolved for, see :meth:`Unix.for_user <platformdirs.unix.Unix.for_user>`, ``None`` for the process's.
+    user_id: int | None
+
+    def create(self) -> PlatformDirsABC:
+        """:returns: a new instance with this configuration"""
+        dirs = self.platform.__new__(self.platform)
+        env = None if self.env is None else dict(self.env)
+        PlatformDirsABC.__init__(dirs, *self[1:-2], env=env)
+        if self.user_id is not None:
+            dirs._user_id = self.user_id  # ruff:ignore[private-member-access]
+        return dirs
+
+
+#: Constructor parameters, in the order :attr:`PlatformDirsABC._config` lists them after the class.
+_CONFIG_PARAMS = (
+    "appname",
+    "appauthor",
+    "version",
+    "roaming",
+    "multipath",
+    "opinion",
+    "ensure_exists",
+    "use_site_for_root",
+)
+
+#: Private attributes pickled along with the constructor arguments, as they hold the same in any process.
+_PICKLED_STATE = frozenset({"_env", "_user_id", "_unique"})
+
+#: Default of each of :data:`_CONFIG_PARAMS`, all singletons so they can be compared by identity.
+_CONFIG_DEFAULTS = (None, None, None, False, False, True, False, False)
+
+
+def _compile_suffix(parts: tuple[str, ...]) -> str:
+    return _intern(os.path.join(*parts)) if parts else ""  # ruff:ignore[os-path-join]
+
+
+def _unpickle(cls: type[PlatformDirsABC], args: tuple[object, ...]) -> PlatformDirsABC:
+    """Rebuild a pickled instance through the base constructor, so subclasses with their own signature unpickle too."""
+    dirs = cls.__new__(cls)
+    PlatformDirsABC.__init__(dirs, *args)  # ruff:ignore[unnecessary-dunder-call]
+    return dirs
+
+
+#: Kinds that also have a directory shared by users.
+_SITE_KINDS = (
+    DirKind.DATA,
+    DirKind.CONFIG,
+    DirKind.CACHE,
+    DirKind.STATE,
+    DirKind.LOG,
+    DirKind.RUNTIME,
+    DirKind.APPLICATIONS,
+    DirKind.BIN,
+)
+
+#: Getters for the ``str`` and :class:`~pathlib.Path` property of every valid kind and scope combination.
+_DISPATCH: dict[tuple[DirKind, Scope], tuple[Callable[[PlatformDirsABC], str], Callable[[PlatformDirsABC], Path]]] = {
+    (kind, scope): (attrgetter(f"{scope}_{kind}_dir"), attrgetter(f"{scope}_{kind}_path"))
+    for scope, kinds in ((Scope.USER, tuple(DirKind)), (Scope.SITE, _SITE_KINDS))
+    for kind in kinds
+}
+
+
+#: Getters for the ``site_*_dirs`` tuple of every kind whose shared directory `multipath` may list in full.
+_SITE_DIRS: dict[DirKind, Callable[[PlatformDirsABC], tuple[str, ...]]] = {
+    kind: attrgetter(f"site_{kind}_dirs")
+    for kind in (DirKind.DATA, DirKind.CONFIG, DirKind.CACHE, DirKind.APPLICATIONS)
+}
+
+
+#: Name and getter of every ``*_dir`` property, in the order :meth:`PlatformDirsABC.resolve_all` returns them.
+_DIR_GETTERS = tuple((f"{scope}_{kind}_dir", get_dir) for (kind, scope), (get_dir, _) in _DISPATCH.items())
+
+
+#: Names :class:`DirPaths` resolves.
+_DIR_NAMES = frozenset(name for name, _ in _DIR_GETTERS)
+
+
+class DirPath(str):  # ruff:ignore[no-slots-in-str-subclass, subclass-builtin]  # needs __dict__ for the lazy path
+    """A resolved directory that is a :class:`str`, with a :class:`~pathlib.Path` view built on first use.
+
+    Works anywhere a ``str`` does, :mod:`os` functions included, so code mixing both need not convert back and forth.
+
+    """
+
+    @cached_property
+    def path(self) -> Path:
+        """The directory as a :class:`~pathlib.Path`, built once and shared with the ``*_path`` properties."""
+        return _as_path(str(self))
+
+    def __truediv__(self, other: str | os.PathLike[str]) -> DirPath:
+        """Join ``other`` onto the directory like :func:`os.path.join`, keeping the result a :class:`DirPath`."""
+        return DirPath(os.path.join(self, other))  # ruff:ignore[os-path-join]
+
+
+class DirPaths:
+    """View of a :class:`PlatformDirsABC` whose ``*_dir`` attributes return :class:`DirPath` instead of :class:`str`.
+
+    Obtained through :attr:`PlatformDirsABC.dirpaths`; directories are resolved on access like the properties they
+    mirror.
+
+    """
+
+    __slots__ = ("_dirs",)
+
+    def __init__(self, dirs: PlatformDirsABC) -> None:
+        """Create a view of ``dirs``."""
+        self._dirs = dirs
+
+    def __getattr__(self, name: str) -> DirPath:
+        """:returns: the ``*_dir`` property ``name`` of the viewed instance as a :class:`DirPath`"""
+        if name not in _DIR_NAMES:
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg)
+        return DirPath(getattr(self._dirs, name))
+
+    def get(self, kind: DirKind | str, scope: Scope | str = Scope.USER) -> DirPath:
+        """:returns: :meth:`PlatformDirsABC.get` as a :class:`DirPath`"""
+        return DirPath(self._dirs.get(kind, scope))
+
+
+class ChildDirs:
+    """Directories of a :class:`PlatformDirsABC` one path segment further down, created by :meth:`~PlatformDirsABC.child`.
+
+    Answers the ``user_*`` and ``site_*`` ``_dir`` and ``_path`` attributes for data, config, cache, state, log and
+    runtime, each being the parent's directory with `name` appended. The parent's directory is read on every access, so
+    creating a view costs no resolution and the view follows the parent's environment. Views nest through `child`.
+
+    """
+
+    __slots__ = ("_created", "_parent", "ensure_exists", "name")
+
+    def __init__(self, parent: PlatformDirsABC | ChildDirs, name: str, *, ensure_exists: bool = False) -> None:
+        """Create a view of ``parent``, see :meth:`PlatformDirsABC.child` for the parameters."""
+        if not name or name in {os.curdir, os.pardir} or os.sep in name or (os.altsep and os.altsep in name):
+            msg = f"child name must be a single path segment, got {name!r}"
+            raise ValueError(msg)
+        self._parent = parent
+        self.name = name  #: The path segment appended to the parent's directories.
+        self.ensure_exists = ensure_exists  #: Whether to create directories on first access.
+        self._created: set[str] = set()
+
+    @property
+    def multipath(self) -> bool:
+        """Whether shared directories list every location, as for the parent."""
+        return self._parent.multipath
+
+    def child(self, name: str, *, ensure_exists: bool | None = None) -> ChildDirs:
+        """:returns: a view one more segment down, see :meth:`PlatformDirsABC.child`"""
+        return ChildDirs(self, name, ensure_exists=self.ensure_exists if ensure_exists is None else ensure_exists)
+
+    @overload
+    def get(self, kind: DirKind | str, scope: Scope | str = ..., *, as_path: Literal[False] = ...) -> str: ...
+    @overload
+    def get(self, kind: DirKind | str, scope: Scope | str = ..., *, as_path: Literal[True]) -> Path: ...
+    def get(self, kind: DirKind | str, scope: Scope | str = Scope.USER, *, as_path: bool = False) -> str | Path:
+        """Look up a directory like :meth:`PlatformDirsABC.get`.
+
+        :raises ValueError: if ``kind`` and ``scope`` name no directory specific to the application.
+
+        """
+        paths = self._locations(kind, scope)
+        if self.ensure_exists:
+            for created in paths:
+                if created not in self._created:
+                    Path(created).mkdir(parents=True, exist_ok=True)
+                    self._created.add(created)
+        if as_path:
+            return _as_path(paths[0])
+        return os.pathsep.join(paths) if len(paths) > 1 else paths[0]
+
+    def _locations(self, kind: DirKind | str, scope: Scope | str) -> tuple[str, ...]:
+        """:returns: every location of a directory like :meth:`PlatformDirsABC._locations`, this view's segment added"""
+        if (kind, scope) not in _CHILD_DIRS:
+            msg = f"no {scope} {kind} directory for a child"
+            raise ValueError(msg)
+        return tuple(_join(path, self.name) for path in self._parent._locations(kind, scope))  # ruff:ignore[private-member-access]
+
+    def __getattr__(self, name: str) -> str | Path:
+        """:returns: the directory attribute ``name``, e.g. ``user_cache_dir`` or ``site_data_path``"""
+        try:
+            kind, scope, as_path = _CHILD_ATTRS[name]
+        except KeyError:
+            msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg) from None
+        return self.get(kind, scope, as_path=as_path)
+
+    def __repr__(self) -> str:
+        """:returns: how the view was created"""
+        return f"{self._parent!r}.child({self.name!r})"
+
+
+class _Resolution(NamedTuple):
+    """What :meth:`PlatformDirsABC.refresh` keeps between calls."""
+
+    config: tuple[object, ...]  #: The configuration the directories were resolved for.
+    variables: dict[str, str]  #: The variables of the fingerprint the directories were resolved from.
+    others: tuple[object, ...]  #: The rest of that fingerprint.
+    dirs: dict[str, str]  #: Every ``*_dir`` property, keyed on its name.
+    dependencies: dict[str, frozenset[str]]  #: The variables each directory read, keyed on its name.
+
+
+class _ResolutionEnv(Mapping[str, str]):
+    """Environment for one :meth:`PlatformDirsABC.resolve_all` pass, reading each variable from ``source`` at most once.
+
+    Values computed from the environment, kept through :func:`_derive`, are shared for the pass too. Every variable
+    asked for is added to `reads`, including those a shared value was computed from.
+
+    """
+
+    def __init__(self, source: Mapping[str, str]) -> None:
+        self._source = source
+        self._values: dict[str, str | None] = {}
+        self._derived: dict[str, tuple[object, frozenset[str]]] = {}
+        self.reads: set[str] = set()
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        self.reads.add(key)
+        try:
+            value = self._values[key]
+        except KeyError:
+            value = self._values[key] = self._source.get(key)
+        return default if value is None else value
+
+    def derive(self, key: str, compute: Callable[[], _T]) -> _T:
+        if (derived := self._derived.get(key)) is None:
+            outer, self.reads = self.reads, set()
+            try:
+                value = compute()
+            finally:
+                reads, self.reads = self.reads, outer
+            derived = self._derived[key] = value, frozenset(reads)
+        self.reads.update(derived[1])
+        return cast("_T", derived[0])
+
+    def __getitem__(self, key: str) -> str:
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+
+def _derive(env: Mapping[str, str], key: str, compute: Callable[[], _T]) -> _T:
+    """Compute a value that depends on ``env`` once per resolution pass, or on every call outside one."""
+    return env.derive(key, compute) if isinstance(env, _ResolutionEnv) else compute()
+
+
+#: ``iter_*_dirs`` method of every kind :meth:`PlatformDirsABC.unique_dirs` accepts.
+_ITER_DIRS: dict[DirKind, Callable[[PlatformDirsABC], Iterator[str]]] = {
+    kind: methodcaller(f"iter_{kind}_dirs")
+    for kind in (DirKind.CONFIG, DirKind.DATA, DirKind.CACHE, DirKind.STATE, DirKind.LOG, DirKind.RUNTIME)
+}
+
+
+#: Directories specific to the application, and so meaningful for :class:`ChildDirs`.
+_CHILD_DIRS = frozenset(key for key in _DISPATCH if key[0] in _ITER_DIRS)
+
+#: Attribute names :class:`ChildDirs` answers, mapped to the kind, scope and whether to return a Path.
+_CHILD_ATTRS = {
+    f"{scope}_{kind}_{suffix}": (kind, scope, suffix == "path")
+    for kind, scope in _CHILD_DIRS
+    for suffix in ("dir", "path")
+}
+
+
+def _dedupe(dirs: tuple[str, ...], *, same_file: bool) -> tuple[str, ...]:
+    seen: set[object] = set()
+    unique = []
+    for directory in dirs:
+        identity: object = directory
+        if same_file:
+            try:
+                stat = os.stat(directory)  # ruff:ignore[os-stat]
+            except OSError:
+                pass
+            else:
+                identity = stat.st_dev, stat.st_ino
+        if identity not in seen:
+            seen.add(identity)
+            unique.append(directory)
+    return tuple(unique)
+
+
+#: Most strings :func:`_intern` keeps before it starts over.
+_INTERN_MAXSIZE = 4096
+
+#: Resolved directories and suffixes handed out, each mapped to itself.
+_interned: dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    """:returns: the string equal to ``value`` handed out before, so equal directories share one object
+
+    Unlike :func:`sys.intern`, whose strings are immortal on Python 3.12, the table is bounded: it starts over once
+    full, so per-tenant or per-plugin directories do not pile up for the life of the process.
+
+    """
+    if (shared := _interned.get(value)) is None:
+        if len(_interned) >= _INTERN_MAXSIZE:
+            _interned.clear()
+        shared = _interned.setdefault(value, value)
+    return shared
+
+
+def _join(base: str, suffix: str) -> str:
+    """Join a compiled suffix onto ``base`` like :func:`os.path.join`, concatenating directly in the common case.
+
+    An empty suffix stands for no parts at all, so ``base`` comes back unchanged rather than with a trailing separator.
+    The result goes through :func:`_intern`, so every instance resolving the same directory shares one string object,
+    which also lets dictionary lookups keyed on it succeed on identity.
+
+    """
+    if not suffix:
+        return base
+    if base and base[-1] not in _JOIN_SPECIAL and suffix[0] not in _JOIN_SPECIAL and suffix[1:2] != ":":
+        return _intern(f"{base}{os.sep}{suffix}")
+    return _intern(os.path.join(base, suffix))  # ruff:ignore[os-path-join]
+
+
+_MISSING: Any = object()
+
+
+class _SharedCache(Generic[_T]):
+    """Memoize a deterministic function of hashable positional arguments in a plain dict.
+
+    A hit is a single dictionary lookup, which takes no lock under free-threaded Python, whereas the
+    :func:`functools.lru_cache` wrapper locks on every call to keep its recency order. Threads missing on the same key
+    at once may each call the function, and either result is kept. Once ``maxsize`` entries are held the cache starts
+    over rather than tracking recency.
+
+    """
+
+    def __init__(self, func: Callable[..., _T], maxsize: int) -> None:
+        self._func = func
+        self._maxsize = maxsize
+        self._values: dict[tuple[Hashable, ...], _T] = {}
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Hashable) -> _T:
+        values = self._values
+        if (value := values.get(args, _MISSING)) is _MISSING:
+            value = self._func(*args)
+            if len(values) >= self._maxsize:
+                values = self._values = {}
+            values[args] = value
+        return cast("_T", value)
+
+    def cache_clear(self) -> None:
+        self._values = {}
+
+
+def _shared_cache(maxsize: int) -> Callable[[Callable[..., _T]], _Cached[_T]]:
+    """Memoize through :func:`functools.lru_cache`, or through :class:`_SharedCache` when the GIL is disabled.
+
+    Resolution runs through these caches on every property access, so with the GIL disabled a per-cache lock would
+    serialize every thread resolving directories.
+
+    """
+    if _FREE_THREADED:
+        return lambda func: _SharedCache(func, maxsize)
+    return lru_cache(maxsize=maxsize)
+
+
+@_shared_cache(maxsize=64)
+def _join_all(bases: tuple[str, ...], suffix: str) -> tuple[str, ...]:
+    """Join ``suffix`` onto each of ``bases``, sharing the result between accesses and instances."""
+    return tuple(_join(base, suffix) for base in bases)
+
+
+@_shared_cache(maxsize=256)
+def _as_path(directory: str) -> Path:
+    """Build the :class:`~pathlib.Path` for a resolved directory once, and hand out the same object afterward.
+
+    Paths are immutable, so sharing them between accesses and instances is safe and spares re-parsing the string.
+
+    """
+    return Path(directory)
+
+
+@_shared_cache(maxsize=64)
+def _as_paths(dirs: tuple[str, ...]) -> tuple[Path, ...]:
+    return tuple(map(_as_path, dirs))
+
+
+#: ``cache_clear`` of every cache registered through :func:`_clear_at_fork`.
+_FORK_LOCAL_CACHES: list[Callable[[], None]] = []
+
+
+def _clear_at_fork(cache: _CacheT) -> _CacheT:
+    """Empty ``cache`` in every forked child, for values probed from the process rather than keyed on their inputs.
+
+    Prefork servers import, and may resolve directories, before forking workers that then drop privileges; the workers
+    probe again on first use instead of inheriting what the parent found.
+
+    """
+    _FORK_LOCAL_CACHES.append(cache.cache_clear)
+    return cache
+
+
+def _clear_fork_local_caches() -> None:
+    for cache_clear in _FORK_LOCAL_CACHES:
+        cache_clear()
+
+
+if hasattr(os, "register_at_fork"):
+    # an interpreter that may not fork, such as an isolated subinterpreter, has nothing to clear
+    with suppress(RuntimeError):
+        os.register_at_fork(after_in_child=_clear_fork_local_caches)
+
+
+def _uid() -> int | None:
+    return None if sys.platform == "win32" else os.getuid()
+
+
+def _stat_stamp(path: str) -> tuple[str, int, int] | tuple[str]:
+    """:returns: ``path`` with its modification time and size, or alone if it does not exist"""
+    try:
+        stat = os.stat(path)  # ruff:ignore[os-stat]
+    except OSError:
+        return (path,)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _expand_user(path: str, env: Mapping[str, str] = os.environ) -> str:
+    """Expand a leading ``~`` through the base directory table shared by every instance.
+
+    Base directories do not depend on the app, so each one is resolved once per value of the variables that locate the
+    home directory, and every later lookup is a dictionary hit. The home directory is taken from ``env``, like
+    :func:`os.path.expanduser` takes it from :data:`os.environ`.
+
+    """
+    return _expand_user_for_home(path, _uid(), *map(env.get, _HOME_ENV_VARS))
+
+
+@_shared_cache(maxsize=128)
+def _expand_user_for_home(path: str, uid: int | None, *home: str | None) -> str:
+    """Expand like :func:`os.path.expanduser`, but with the home directory variables passed in as ``home``.
+
+    Without them the home directory of ``uid`` is looked up, so a process dropping privileges, e.g. a forked worker,
+    does not reuse the expansion made for its former user.
+
+    """
+    end = next((index for index, char in enumerate(path) if char in _SEPARATORS), len(path))
+    if not path.startswith("~") or end > 1:  # nothing to expand, or another user's ``~name`` the system knows about
+        return _intern(os.path.expanduser(path))  # ruff:ignore[os-path-expanduser]  # API returns str, not Path
+    if os.name == "nt":
+        user_profile, home_drive, home_path = home
+        if user_profile:
+            user_home = user_profile
+        elif home_path is None:
+            return _intern(path)
+        else:
+            user_home = os.path.join(home_drive or "", home_path)  # ruff:ignore[os-path-join]
+        return _intern(user_home + path[end:])
+    if home[0] is not None:
+        user_home = home[0]
+    else:
+        try:
+            import pwd  # ruff:ignore[import-outside-top-level]
+
+            user_home = pwd.getpwuid(cast("int", uid)).pw_dir
+        except (ImportError, KeyError):
+            return _intern(path)
+    return _intern(user_home.rstrip("/") + path[end:] or "/")
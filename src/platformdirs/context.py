@@ -0,0 +1,80 @@
+"""Context-local defaults and overrides for the module-level functions such as :func:`platformdirs.user_data_dir`."""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .api import _CONFIG_DEFAULTS, _CONFIG_PARAMS, _DIR_NAMES
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+
+
+class _Scope(NamedTuple):
+    params: dict[str, Any]  #: Constructor parameters applied where the caller passes the default value.
+    overrides: dict[str, str]  #: Directories returned as is, keyed on ``*_dir`` name.
+
+    def apply(self, params: dict[str, Any]) -> dict[str, Any]:
+        """:returns: ``params`` with those at their default value, passed or not, taken from the scope"""
+        given = {name: value for name, value in params.items() if value is not _DEFAULTS[name]}
+        return {**self.params, **given}
+
+
+#: The innermost active :func:`scoped` block of the current context, ``None`` outside of any.
+_current: ContextVar[_Scope | None] = ContextVar("platformdirs_scope", default=None)
+
+_DEFAULTS = dict(zip(_CONFIG_PARAMS, _CONFIG_DEFAULTS, strict=True))
+
+
+@contextmanager
+def scoped(overrides: Mapping[str, str | os.PathLike[str]] | None = None, **params: Any) -> Generator[None]:  # ruff:ignore[any-type]
+    """Set directory defaults and overrides for the module-level functions, for the current context only.
+
+    Inside the block, :func:`~platformdirs.user_data_dir` and the other module-level functions use ``params`` for every
+    constructor argument at its default value, and return ``overrides`` as is. The functions cannot tell an argument
+    passed at its default value, e.g. ``opinion=True``, from one left out, so such an argument takes the scope's value
+    too; nest another block, or create an instance, to get the default back. The settings live in a
+    :class:`~contextvars.ContextVar`, so concurrent asyncio tasks and threads each see their own, with no locking and
+    no environment variables touched. Blocks nest, inner settings winning. :class:`~platformdirs.PlatformDirs`
+    instances created directly are not affected.
+
+    .. code-block:: python
+
+        with platformdirs.scoped(appname=f"svc-{tenant}", overrides={"user_cache_dir": "/srv/cache"}):
+            platformdirs.user_data_path()  # data directory of svc-$tenant
+            platformdirs.user_cache_dir()  # "/srv/cache"
+
+    :param overrides: directories to return as is, keyed on ``*_dir`` name; the ``*_path`` functions follow them.
+    :param params: constructor arguments such as ``appname`` or ``version``, see
+        :class:`~platformdirs.api.PlatformDirsABC`.
+    :raises TypeError: for an unknown parameter or override name.
+
+    """
+    if unknown := params.keys() - _DEFAULTS.keys():
+        msg = f"unknown parameter(s) {', '.join(sorted(unknown))}"
+        raise TypeError(msg)
+    overrides = {} if overrides is None else overrides
+    if unknown := overrides.keys() - _DIR_NAMES:
+        msg = f"unknown directory name(s) {', '.join(sorted(unknown))}"
+        raise TypeError(msg)
+    outer = _current.get()
+    scope = _Scope(
+        params={**outer.params, **params} if outer else dict(params),
+        overrides={
+            **(outer.overrides if outer else {}),
+            **{name: os.fspath(path) for name, path in overrides.items()},
+        },
+    )
+    token = _current.set(scope)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+__all__ = [
+    "scoped",
+]
@@ -0,0 +1,163 @@
+"""Bounded factory that hands out shared :class:`~platformdirs.api.PlatformDirsABC` instances."""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import Literal
+
+    from .api import PlatformDirsABC
+
+    _Key = tuple[
+        str | None,
+        str | Literal[False] | None,
+        str | None,
+        bool,
+        bool,
+        bool,
+        bool,
+        bool,
+        frozenset[tuple[str, str]] | None,
+    ]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`PlatformDirsFactory`, mirroring :func:`functools.lru_cache`'s ``cache_info()``."""
+
+    hits: int  #: Lookups answered by an existing instance.
+    misses: int  #: Lookups that had to create an instance.
+    evictions: int  #: Instances dropped to stay within ``maxsize``.
+    maxsize: int | None  #: The configured bound, ``None`` when unbounded.
+    currsize: int  #: Instances currently held.
+
+
+class PlatformDirsFactory:
+    """Hand out one shared instance per distinct set of parameters, keeping at most ``maxsize`` of them.
+
+    Meant for services that build a directory object per request, e.g. one ``appname`` per tenant: the instance is
+    created on first use and reused afterward. Once the bound is reached, the oldest instance not used since the last
+    eviction sweep is dropped, a second-chance approximation of least recently used that lets a lookup of an existing
+    instance take no lock, so threads do not queue on it under free-threaded Python. Base directories are shared by
+    every instance regardless, so the cost of a lookup does not grow with the number of tenants.
+
+    Instances are shared between every caller asking for the same parameters, so they must not be mutated.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 1024,
+        *,
+        dirs_class: type[PlatformDirsABC] | None = None,
+        on_evict: Callable[[PlatformDirsABC], None] | None = None,
+    ) -> None:
+        """Create a new factory.
+
+        :param maxsize: the most instances to keep, ``None`` for no bound.
+        :param dirs_class: the class to instantiate, defaults to :data:`~platformdirs.PlatformDirs`.
+        :param on_evict: called with each instance dropped to stay within ``maxsize``, e.g. to flush or log it.
+
+        """
+        if maxsize is not None and maxsize < 1:
+            msg = f"maxsize must be at least 1 or None, got {maxsize}"
+            raise ValueError(msg)
+        if dirs_class is None:
+            from platformdirs import PlatformDirs  # ruff:ignore[import-outside-top-level]  # circular import
+
+            dirs_class = PlatformDirs
+        self.maxsize = maxsize
+        self.dirs_class = dirs_class
+        self.on_evict = on_evict
+        #: Instances in insertion order, each with whether it was used since the last eviction sweep passed it.
+        self._instances: dict[_Key, list[Any]] = {}
+        self._lock = Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __call__(  # ruff:ignore[too-many-arguments, too-many-positional-arguments]
+        self,
+        appname: str | None = None,
+        appauthor: str | Literal[False] | None = None,
+        version: str | None = None,
+        roaming: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        multipath: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        opinion: bool = True,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        ensure_exists: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        use_site_for_root: bool = False,  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        *,
+        env: Mapping[str, str] | None = None,
+    ) -> PlatformDirsABC:
+        """:returns: the shared instance for these parameters, see :class:`~platformdirs.api.PlatformDirsABC`
+
+        An ``env`` mapping is keyed on its contents, so every equal snapshot shares one instance.
+
+        """
+        key: _Key = (
+            appname,
+            appauthor,
+            version,
+            roaming,
+            multipath,
+            opinion,
+            ensure_exists,
+            use_site_for_root,
+            None if env is None else frozenset(env.items()),
+        )
+        if (entry := self._instances.get(key)) is None:
+            with self._lock:
+                if (entry := self._instances.get(key)) is None:
+                    self._misses += 1
+                    dirs = self.dirs_class(*key[:-1], env=env)
+                    self._instances[key] = [dirs, False]
+                    evicted = self._evict(key)
+            if entry is None:
+                for old in evicted:
+                    self._notify(old)
+                return dirs
+        entry[1] = True
+        self._hits += 1
+        return cast("PlatformDirsABC", entry[0])
+
+    def _evict(self, added: _Key) -> list[PlatformDirsABC]:
+        evicted = []
+        while self.maxsize is not None and len(self._instances) > self.maxsize:
+            key = next(iter(self._instances))
+            entry = self._instances.pop(key)
+            if entry[1] or key == added:
+                entry[1] = False
+                self._instances[key] = entry  # second chance, behind every other instance
+            else:
+                evicted.append(entry[0])
+        self._evictions += len(evicted)
+        return evicted
+
+    def _notify(self, dirs: PlatformDirsABC) -> None:
+        if self.on_evict is not None:
+            self.on_evict(dirs)
+
+    def cache_info(self) -> CacheInfo:
+        """:returns: hit, miss and eviction counters along with the current size
+
+        Hits are counted without a lock, so threads hitting at the same moment may be counted once.
+
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._instances))
+
+    def cache_clear(self) -> None:
+        """Drop every instance and reset the counters; ``on_evict`` is not called."""
+        with self._lock:
+            self._instances.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        """:returns: the number of instances currently held"""
+        return len(self._instances)
+
+
+__all__ = [
+    "CacheInfo",
+    "PlatformDirsFactory",
+]
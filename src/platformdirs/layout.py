@@ -0,0 +1,123 @@
+"""Declarative trees of directories under the platform directories."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, overload
+
+from .api import _DISPATCH, DirKind, Scope
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .api import PlatformDirsABC
+
+
+class LayoutDir:
+    """A directory of a :class:`Layout`, declared as a class attribute and read as a :class:`~pathlib.Path`."""
+
+    def __init__(self, kind: DirKind | str, *parts: str, scope: Scope | str = Scope.USER) -> None:
+        """Declare a directory.
+
+        :param kind: the platform directory the tree hangs off, e.g. ``DirKind.CACHE``.
+        :param parts: path segments below it.
+        :param scope: whether the platform directory is tied to the user or shared by users.
+        :raises ValueError: if there is no such platform directory.
+
+        """
+        if (kind, scope) not in _DISPATCH:
+            msg = f"no {scope} {kind} directory"
+            raise ValueError(msg)
+        self.kind = DirKind(kind)  #: The platform directory the tree hangs off.
+        self.scope = Scope(scope)  #: Whether that directory is tied to the user or shared.
+        self.parts = parts  #: Path segments below it.
+        self.name = ""  #: Attribute name in the layout, set when the class is created.
+
+    def __set_name__(self, owner: type[Layout], name: str) -> None:
+        """Record the attribute name the directory is declared under."""
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type[Layout]) -> LayoutDir: ...
+    @overload
+    def __get__(self, instance: Layout, owner: type[Layout]) -> Path: ...
+    def __get__(self, instance: Layout | None, owner: type[Layout]) -> LayoutDir | Path:
+        """:returns: the resolved directory, which is then kept on the instance, or the declaration on the class"""
+        if instance is None:
+            return self
+        path = instance.__dict__[self.name] = self.resolve(instance.dirs)
+        return path
+
+    def resolve(self, dirs: PlatformDirsABC) -> Path:
+        """:returns: the directory for ``dirs``"""
+        return dirs.get(self.kind, self.scope, as_path=True).joinpath(*self.parts)
+
+
+class Layout:
+    """A fixed tree of directories under the platform directories, declared once as a subclass.
+
+    Each :class:`LayoutDir` attribute resolves to a :class:`~pathlib.Path` on first access and is kept on the instance
+    afterward, so build the layout when the environment is settled, e.g. at startup. `create` makes the whole tree in
+    one pass.
+
+    .. code-block:: python
+
+        class AppLayout(Layout):
+            http = LayoutDir(DirKind.CACHE, "http")
+            models = LayoutDir(DirKind.DATA, "models", "v3")
+            audit = LayoutDir(DirKind.LOG, "audit")
+
+
+        layout = AppLayout(PlatformDirs("MyApp", "Acme"))
+        layout.create()
+        layout.http  # Path to the http cache directory
+
+    """
+
+    #: Every :class:`LayoutDir` of the class and its bases, keyed on attribute name.
+    layout_dirs: ClassVar[dict[str, LayoutDir]] = {}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Collect the directories the subclass declares on top of those it inherits."""
+        super().__init_subclass__(**kwargs)
+        declared = {name: value for name, value in vars(cls).items() if isinstance(value, LayoutDir)}
+        cls.layout_dirs = {**cls.layout_dirs, **declared}
+
+    def __init__(self, dirs: PlatformDirsABC) -> None:
+        """Create the layout of ``dirs``; nothing is resolved until a directory is read."""
+        self.dirs = dirs  #: The platform directories the tree hangs off.
+
+    def paths(self) -> dict[str, Path]:
+        """:returns: every directory of the layout, keyed on attribute name"""
+        return {name: getattr(self, name) for name in self.layout_dirs}
+
+    def create(self) -> list[Path]:
+        """Create every directory of the layout, and any missing parent, in one pass.
+
+        Directories are handled in sorted order so parents come before their children, and each ancestor is checked
+        at most once however many directories share it.
+
+        :returns: the directories that were created, parents first
+
+        """
+        known: set[Path] = set()
+        created: list[Path] = []
+        for path in sorted(set(self.paths().values())):
+            missing: list[Path] = []
+            current = path
+            while current not in known and not current.is_dir():
+                missing.append(current)
+                if current.parent == current:
+                    break
+                current = current.parent
+            known.add(current)
+            for directory in reversed(missing):
+                directory.mkdir(exist_ok=True)
+                known.add(directory)
+                created.append(directory)
+        return created
+
+
+__all__ = [
+    "Layout",
+    "LayoutDir",
+]
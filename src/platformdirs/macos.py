@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
 from ._xdg import XDGMixin
-from .api import PlatformDirsABC
+from .api import PlatformDirsABC, _expand_user
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -26,14 +26,13 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     """
 
     def _base_user_app_support_dir(self) -> str:
-        return self._append_app_name_and_version(os.path.expanduser("~/Library/Application Support"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/Library/Application Support", self._env))
 
-    def _base_site_dirs(self) -> list[str]:
+    def _base_site_dirs(self) -> tuple[str, ...]:
         is_homebrew = "/opt/python" in sys.prefix
         homebrew_prefix = sys.prefix.split("/opt/python")[0] if is_homebrew else ""
-        path_list = [self._append_app_name_and_version(f"{homebrew_prefix}/share")] if is_homebrew else []
-        path_list.append(self._append_app_name_and_version("/Library/Application Support"))
-        return path_list
+        bases = (f"{homebrew_prefix}/share", "/Library/Application Support")
+        return self._append_app_name_and_version_all(bases if is_homebrew else bases[1:])
 
     @property
     def user_data_dir(self) -> str:
@@ -41,18 +40,18 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         return self._base_user_app_support_dir()
 
     @property
-    def _site_data_dirs(self) -> list[str]:
+    def _site_data_dirs(self) -> tuple[str, ...]:
         return self._base_site_dirs()
 
     @property
     def site_data_path(self) -> Path:
         """Data path shared by users. Only return the first item, even if ``multipath`` is set to ``True``."""
-        return self._first_item_as_path_if_multipath(self.site_data_dir)
+        return self.site_data_paths[0]
 
     @property
     def site_config_path(self) -> Path:
         """Config path shared by users. Only return the first item, even if ``multipath`` is set to ``True``."""
-        return self._first_item_as_path_if_multipath(self.site_config_dir)
+        return self.site_config_paths[0]
 
     @property
     def user_config_dir(self) -> str:
@@ -60,21 +59,25 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         return self._base_user_app_support_dir()
 
     @property
-    def _site_config_dirs(self) -> list[str]:
+    def _site_config_dirs(self) -> tuple[str, ...]:
         return self._base_site_dirs()
 
     @property
     def user_cache_dir(self) -> str:
         """Cache directory tied to the user, e.g. ``~/Library/Caches/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/Library/Caches"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/Library/Caches", self._env))
 
     @property
-    def _site_cache_dirs(self) -> list[str]:
+    def _site_cache_dirs(self) -> tuple[str, ...]:
         is_homebrew = "/opt/python" in sys.prefix
         homebrew_prefix = sys.prefix.split("/opt/python")[0] if is_homebrew else ""
-        path_list = [self._append_app_name_and_version(f"{homebrew_prefix}/var/cache")] if is_homebrew else []
-        path_list.append(self._append_app_name_and_version("/Library/Caches"))
-        return path_list
+        bases = (f"{homebrew_prefix}/var/cache", "/Library/Caches")
+        return self._append_app_name_and_version_all(bases if is_homebrew else bases[1:])
+
+    @property
+    def site_cache_dirs(self) -> tuple[str, ...]:
+        """Cache directories shared by users, the Homebrew prefix one first when running under Homebrew."""
+        return self._site_cache_dirs
 
     @property
     def site_cache_dir(self) -> str:
@@ -85,7 +88,7 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def site_cache_path(self) -> Path:
         """Cache path shared by users. Only return the first item, even if ``multipath`` is set to ``True``."""
-        return self._first_item_as_path_if_multipath(self.site_cache_dir)
+        return self.site_cache_paths[0]
 
     @property
     def user_state_dir(self) -> str:
@@ -100,7 +103,7 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_log_dir(self) -> str:
         """Log directory tied to the user, e.g. ``~/Library/Logs/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/Library/Logs"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/Library/Logs", self._env))
 
     @property
     def site_log_dir(self) -> str:
@@ -110,62 +113,62 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_documents_dir(self) -> str:
         """Documents directory tied to the user, e.g. ``~/Documents``."""
-        return os.path.expanduser("~/Documents")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Documents", self._env)
 
     @property
     def user_downloads_dir(self) -> str:
         """Downloads directory tied to the user, e.g. ``~/Downloads``."""
-        return os.path.expanduser("~/Downloads")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Downloads", self._env)
 
     @property
     def user_pictures_dir(self) -> str:
         """Pictures directory tied to the user, e.g. ``~/Pictures``."""
-        return os.path.expanduser("~/Pictures")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Pictures", self._env)
 
     @property
     def user_videos_dir(self) -> str:
         """Videos directory tied to the user, e.g. ``~/Movies``."""
-        return os.path.expanduser("~/Movies")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Movies", self._env)
 
     @property
     def user_music_dir(self) -> str:
         """Music directory tied to the user, e.g. ``~/Music``."""
-        return os.path.expanduser("~/Music")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Music", self._env)
 
     @property
     def user_desktop_dir(self) -> str:
         """Desktop directory tied to the user, e.g. ``~/Desktop``."""
-        return os.path.expanduser("~/Desktop")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Desktop", self._env)
 
     @property
     def user_projects_dir(self) -> str:
         """Projects directory tied to the user, e.g. ``~/Projects``."""
-        return os.path.expanduser("~/Projects")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Projects", self._env)
 
     @property
     def user_publicshare_dir(self) -> str:
         """Public share directory tied to the user, e.g. ``~/Public``."""
-        return os.path.expanduser("~/Public")  # ruff:ignore[os-path-expanduser]  # API returns str, not Path
+        return _expand_user("~/Public", self._env)
 
     @property
     def user_templates_dir(self) -> str:
         """Templates directory tied to the user, e.g. ``~/Templates``."""
-        return os.path.expanduser("~/Templates")  # ruff:ignore[os-path-expanduser]  # API returns str, not Path
+        return _expand_user("~/Templates", self._env)
 
     @property
     def user_fonts_dir(self) -> str:
         """Fonts directory tied to the user, e.g. ``~/Library/Fonts``."""
-        return os.path.expanduser("~/Library/Fonts")  # ruff:ignore[os-path-expanduser]  # API returns str, not Path
+        return _expand_user("~/Library/Fonts", self._env)
 
     @property
     def user_preference_dir(self) -> str:
         """Preference directory tied to the user, e.g. ``~/Library/Preferences/AppName``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/Library/Preferences"))  # ruff:ignore[os-path-expanduser]  # API returns str, not Path
+        return self._append_app_name_and_version(_expand_user("~/Library/Preferences", self._env))
 
     @property
     def user_bin_dir(self) -> str:
         """Bin directory tied to the user, e.g. ``~/.local/bin``."""
-        return os.path.expanduser("~/.local/bin")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/.local/bin", self._env)
 
     @property
     def site_bin_dir(self) -> str:
@@ -175,11 +178,11 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_applications_dir(self) -> str:
         """Applications directory tied to the user, e.g. ``~/Applications``."""
-        return os.path.expanduser("~/Applications")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/Applications", self._env)
 
     @property
-    def _site_applications_dirs(self) -> list[str]:
-        return ["/Applications"]
+    def _site_applications_dirs(self) -> tuple[str, ...]:
+        return ("/Applications",)
 
     @property
     def site_applications_dir(self) -> str:
@@ -190,7 +193,7 @@ class _MacOSDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_runtime_dir(self) -> str:
         """Runtime directory tied to the user, e.g. ``~/Library/Caches/TemporaryItems/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/Library/Caches/TemporaryItems"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/Library/Caches/TemporaryItems", self._env))
 
     @property
     def site_runtime_dir(self) -> str:
@@ -0,0 +1,83 @@
+"""Resolve and create the directories of applications up front, before forking worker processes."""
+
+from __future__ import annotations
+
+from copy import copy
+from typing import TYPE_CHECKING, Any
+
+from .api import _DISPATCH, PlatformDirsABC, Scope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .factory import PlatformDirsFactory
+
+
+def warmup(
+    specs: Iterable[PlatformDirsABC | Mapping[str, Any]],
+    *,
+    scope: Scope | str | None = None,
+    ensure_exists: bool = False,
+    factory: PlatformDirsFactory | None = None,
+) -> list[PlatformDirsABC]:
+    """Resolve, and optionally create, every directory of ``specs`` now, e.g. in a prefork server before forking.
+
+    Directories are created once here rather than by every worker. Resolving also fills the caches of each instance's
+    application suffix, of the interned path strings and of the :class:`~pathlib.Path` objects behind the ``*_path``
+    properties, which forked workers inherit through copy-on-write. Properties still read the environment on every
+    access, so this spares workers the first-access cost only, and :class:`~pathlib.Path` objects are kept for the few
+    hundred most recently resolved directories, so with many ``specs`` only the last stay warm. Values probed from the
+    process rather than derived from the environment, such as Windows known folders, are probed again in each worker,
+    see :ref:`api:Forked workers`.
+
+    .. code-block:: python
+
+        dirs = platformdirs.warmup([{"appname": "svc", "version": "1.0"}], scope="user", ensure_exists=True)
+
+    :param specs: instances, or mappings of constructor arguments such as ``{"appname": "svc"}``.
+    :param scope: resolve only the directories tied to the user or only those shared by users, ``None`` for both.
+    :param ensure_exists: create the directories resolved, only those tied to the user unless ``scope`` is ``"site"``,
+        as creating shared ones mostly takes root. Without it nothing is created, even for instances with
+        `ensure_exists <platformdirs.api.PlatformDirsABC.ensure_exists>` set.
+    :param factory: create the instances of mappings through this factory, so workers asking it for the same
+        parameters get them.
+    :returns: the instances, in the order of ``specs``
+    :raises ValueError: for an unknown ``scope``.
+    :raises OSError: if a directory cannot be created.
+
+    """
+    keys = [key for key in _DISPATCH if scope is None or key[1] is Scope(scope)]
+    created = keys if scope is not None else [key for key in keys if key[1] is Scope.USER]
+    warmed = []
+    for spec in specs:
+        dirs = _instance(spec, factory)
+        resolver = dirs
+        if dirs.ensure_exists:  # resolve without creating, which only the keys in ``created`` may do
+            resolver = copy(dirs)
+            resolver.ensure_exists = False
+        for kind, key_scope in keys:
+            resolver.get(kind, key_scope, as_path=True)
+        if ensure_exists:
+            creator = dirs
+            if not dirs.ensure_exists:
+                creator = copy(dirs)
+                creator.ensure_exists = True
+            for kind, key_scope in created:
+                creator.get(kind, key_scope)
+        warmed.append(dirs)
+    return warmed
+
+
+def _instance(spec: PlatformDirsABC | Mapping[str, Any], factory: PlatformDirsFactory | None) -> PlatformDirsABC:
+    if isinstance(spec, PlatformDirsABC):
+        return spec
+    if factory is not None:
+        return factory(**spec)
+    from platformdirs import PlatformDirs  # ruff:ignore[import-outside-top-level]  # circular import
+
+    return PlatformDirs(**spec)
+
+
+__all__ = [
+    "warmup",
+]
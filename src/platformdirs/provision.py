@@ -0,0 +1,113 @@
+"""Create the directories of many applications at once, e.g. one per tenant or plugin."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from copy import copy
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .api import DirKind, Scope
+from .prefork import _instance
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from .api import PlatformDirsABC
+    from .factory import PlatformDirsFactory
+
+
+class Provisioned(NamedTuple):
+    """Outcome of creating one directory through :func:`provision`."""
+
+    created: bool  #: Whether the directory was created, rather than already there.
+    error: OSError | None  #: Why the directory could not be created, ``None`` when it exists now.
+
+
+#: Kinds :func:`provision` creates unless told otherwise.
+_PROVISION_KINDS = (DirKind.DATA, DirKind.CONFIG, DirKind.CACHE, DirKind.STATE, DirKind.LOG)
+
+
+def provision(
+    specs: Iterable[PlatformDirsABC | Mapping[str, Any]],
+    kinds: Iterable[DirKind | str] = _PROVISION_KINDS,
+    *,
+    scope: Scope | str = Scope.USER,
+    max_workers: int | None = None,
+    factory: PlatformDirsFactory | None = None,
+) -> dict[Path, Provisioned]:
+    """Create the directories of many applications at once, e.g. one per tenant or plugin.
+
+    Every directory is resolved first, and duplicates dropped. Their parents, which applications mostly share, are
+    then created once each, and finally every directory itself, split in one batch per thread of a pool of
+    ``max_workers``. Threads pay off where each ``mkdir`` waits on the network, e.g. on NFS; a local disk or tmpfs
+    answers faster than threads can share out the work, so pass ``max_workers=1`` there to create them in turn. A
+    directory that cannot be created is reported rather than raised, so one failure does not stop the rest.
+
+    .. code-block:: python
+
+        outcome = platformdirs.provision([{"appname": f"svc-{tenant}"} for tenant in tenants], ["cache", "log"])
+        failed = {path: result.error for path, result in outcome.items() if result.error}
+
+    :param specs: instances, or mappings of constructor arguments such as ``{"appname": "svc"}``.
+    :param kinds: the kinds of directory to create, by default data, config, cache, state and log.
+    :param scope: whether the directories are tied to the user or shared by users; shared directories are created at
+        every location for instances with `multipath <platformdirs.api.PlatformDirsABC.multipath>` set.
+    :param max_workers: the most threads to create directories from, as for
+        :class:`~concurrent.futures.ThreadPoolExecutor`.
+    :param factory: create the instances of mappings through this factory.
+    :returns: the outcome for every directory, keyed on its path, in the order of ``specs`` then ``kinds``
+    :raises ValueError: if there is no such directory, e.g. a shared documents directory.
+
+    """
+    kinds = tuple(kinds)
+    targets: dict[str, None] = {}
+    for spec in specs:
+        dirs = _instance(spec, factory)
+        if dirs.ensure_exists:
+            dirs = copy(dirs)
+            dirs.ensure_exists = False
+        for kind in kinds:
+            targets.update(dict.fromkeys(dirs._locations(kind, scope)))  # ruff:ignore[private-member-access]
+    # strings rather than Path objects until the end, building and hashing those costs more than a mkdir on tmpfs
+    for parent in {os.path.dirname(target) for target in targets} - targets.keys():  # ruff:ignore[os-path-dirname]
+        with suppress(OSError):  # reported for each directory below it instead
+            os.makedirs(parent, exist_ok=True)  # ruff:ignore[os-makedirs]
+    paths = list(targets)
+    workers = min(max_workers or min(32, (os.cpu_count() or 1) + 4), len(paths))  # the pool's own default bound
+    if workers <= 1:
+        results = list(map(_make_dir, paths))
+    else:
+        # one contiguous batch per thread rather than a task per directory, which would cost more than many a mkdir
+        size = -(-len(paths) // workers)
+        with ThreadPoolExecutor(workers) as pool:
+            batches = pool.map(_make_dirs, (paths[start : start + size] for start in range(0, len(paths), size)))
+            results = [result for batch in batches for result in batch]
+    return dict(zip(map(Path, paths), results, strict=True))
+
+
+def _make_dirs(paths: list[str]) -> list[Provisioned]:
+    return list(map(_make_dir, paths))
+
+
+def _make_dir(path: str) -> Provisioned:
+    try:
+        os.mkdir(path)  # ruff:ignore[os-mkdir]
+    except FileExistsError as error:
+        return Provisioned(created=False, error=None if os.path.isdir(path) else error)  # ruff:ignore[os-path-isdir]
+    except FileNotFoundError:  # its parent is itself provisioned, and was not created yet
+        try:
+            os.makedirs(path)  # ruff:ignore[os-makedirs]
+        except OSError as error:
+            return Provisioned(created=False, error=None if os.path.isdir(path) else error)  # ruff:ignore[os-path-isdir]
+    except OSError as error:
+        return Provisioned(created=False, error=error)
+    return Provisioned(created=True, error=None)
+
+
+__all__ = [
+    "Provisioned",
+    "provision",
+]
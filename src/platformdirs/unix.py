@@ -5,16 +5,18 @@ from __future__ import annotations
 import os
 import sys
 from configparser import ConfigParser
-from functools import cached_property
+from functools import partial
 from pathlib import Path
 from tempfile import gettempdir
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING, Any, NoReturn
 
 from ._xdg import XDGMixin
-from .api import PlatformDirsABC
+from .api import PlatformDirsABC, _derive, _expand_user, _join, _join_all, _shared_cache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Mapping
+    from configparser import SectionProxy
+    from pwd import struct_passwd
 
 if sys.platform == "win32":
 
@@ -33,32 +35,40 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
 
     """
 
-    @cached_property
+    @property
+    def _uid(self) -> int:
+        return getuid() if self._user_id is None else self._user_id
+
+    @property
     def _use_site(self) -> bool:
-        return self.use_site_for_root and getuid() == 0
+        """Checked on every access, as the process may drop root privileges after the instance was created."""
+        return self.use_site_for_root and self._uid == 0
+
+    def _input_files(self, env: Mapping[str, str]) -> tuple[str, ...]:  # ruff:ignore[no-self-use]
+        return (_user_dirs_path(env),)
 
     @property
     def user_data_dir(self) -> str:
         """Data directory tied to the user, e.g. ``~/.local/share/$appname/$version`` or ``$XDG_DATA_HOME/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/.local/share"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/.local/share", self._env))
 
     @property
-    def _site_data_dirs(self) -> list[str]:
-        return [self._append_app_name_and_version("/usr/local/share"), self._append_app_name_and_version("/usr/share")]
+    def _site_data_dirs(self) -> tuple[str, ...]:
+        return self._append_app_name_and_version_all(("/usr/local/share", "/usr/share"))
 
     @property
     def user_config_dir(self) -> str:
         """Config directory tied to the user, e.g. ``~/.config/$appname/$version`` or ``$XDG_CONFIG_HOME/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/.config"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/.config", self._env))
 
     @property
-    def _site_config_dirs(self) -> list[str]:
-        return [self._append_app_name_and_version("/etc/xdg")]
+    def _site_config_dirs(self) -> tuple[str, ...]:
+        return self._append_app_name_and_version_all(("/etc/xdg",))
 
     @property
     def user_cache_dir(self) -> str:
         """Cache directory tied to the user, e.g. ``~/.cache/$appname/$version`` or ``$XDG_CACHE_HOME/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/.cache"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/.cache", self._env))
 
     @property
     def site_cache_dir(self) -> str:
@@ -68,7 +78,7 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_state_dir(self) -> str:
         """State directory tied to the user, e.g. ``~/.local/state/$appname/$version`` or ``$XDG_STATE_HOME/$appname/$version``."""
-        return self._append_app_name_and_version(os.path.expanduser("~/.local/state"))  # ruff:ignore[os-path-expanduser]
+        return self._append_app_name_and_version(_expand_user("~/.local/state", self._env))
 
     @property
     def site_state_dir(self) -> str:
@@ -80,7 +90,7 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         """Log directory tied to the user, same as `user_state_dir` if not opinionated else ``log`` in it."""
         path = self.user_state_dir
         if self.opinion:
-            path = os.path.join(path, "log")  # ruff:ignore[os-path-join]
+            path = _join(path, "log")
             self._optionally_create_directory(path)
         return path
 
@@ -96,52 +106,52 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_documents_dir(self) -> str:
         """Documents directory tied to the user, e.g. ``~/Documents``."""
-        return _get_user_media_dir("XDG_DOCUMENTS_DIR", "~/Documents")
+        return _get_user_media_dir("XDG_DOCUMENTS_DIR", "~/Documents", self._env)
 
     @property
     def user_downloads_dir(self) -> str:
         """Downloads directory tied to the user, e.g. ``~/Downloads``."""
-        return _get_user_media_dir("XDG_DOWNLOAD_DIR", "~/Downloads")
+        return _get_user_media_dir("XDG_DOWNLOAD_DIR", "~/Downloads", self._env)
 
     @property
     def user_pictures_dir(self) -> str:
         """Pictures directory tied to the user, e.g. ``~/Pictures``."""
-        return _get_user_media_dir("XDG_PICTURES_DIR", "~/Pictures")
+        return _get_user_media_dir("XDG_PICTURES_DIR", "~/Pictures", self._env)
 
     @property
     def user_videos_dir(self) -> str:
         """Videos directory tied to the user, e.g. ``~/Videos``."""
-        return _get_user_media_dir("XDG_VIDEOS_DIR", "~/Videos")
+        return _get_user_media_dir("XDG_VIDEOS_DIR", "~/Videos", self._env)
 
     @property
     def user_music_dir(self) -> str:
         """Music directory tied to the user, e.g. ``~/Music``."""
-        return _get_user_media_dir("XDG_MUSIC_DIR", "~/Music")
+        return _get_user_media_dir("XDG_MUSIC_DIR", "~/Music", self._env)
 
     @property
     def user_desktop_dir(self) -> str:
         """Desktop directory tied to the user, e.g. ``~/Desktop``."""
-        return _get_user_media_dir("XDG_DESKTOP_DIR", "~/Desktop")
+        return _get_user_media_dir("XDG_DESKTOP_DIR", "~/Desktop", self._env)
 
     @property
     def user_projects_dir(self) -> str:
         """Projects directory tied to the user, e.g. ``~/Projects``."""
-        return _get_user_media_dir("XDG_PROJECTS_DIR", "~/Projects")
+        return _get_user_media_dir("XDG_PROJECTS_DIR", "~/Projects", self._env)
 
     @property
     def user_publicshare_dir(self) -> str:
         """Public share directory tied to the user, e.g. ``~/Public``."""
-        return _get_user_media_dir("XDG_PUBLICSHARE_DIR", "~/Public")
+        return _get_user_media_dir("XDG_PUBLICSHARE_DIR", "~/Public", self._env)
 
     @property
     def user_templates_dir(self) -> str:
         """Templates directory tied to the user, e.g. ``~/Templates``."""
-        return _get_user_media_dir("XDG_TEMPLATES_DIR", "~/Templates")
+        return _get_user_media_dir("XDG_TEMPLATES_DIR", "~/Templates", self._env)
 
     @property
     def user_fonts_dir(self) -> str:
         """Fonts directory tied to the user, e.g. ``~/.local/share/fonts``."""
-        return f"{os.path.expanduser('~/.local/share')}/fonts"  # ruff:ignore[os-path-expanduser]  # API returns str, not Path
+        return f"{_expand_user('~/.local/share', self._env)}/fonts"
 
     @property
     def user_preference_dir(self) -> str:
@@ -151,7 +161,7 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_bin_dir(self) -> str:
         """Bin directory tied to the user, e.g. ``~/.local/bin``."""
-        return os.path.expanduser("~/.local/bin")  # ruff:ignore[os-path-expanduser]
+        return _expand_user("~/.local/bin", self._env)
 
     @property
     def site_bin_dir(self) -> str:
@@ -161,11 +171,11 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_applications_dir(self) -> str:
         """Applications directory tied to the user, e.g. ``~/.local/share/applications``."""
-        return os.path.join(os.path.expanduser("~/.local/share"), "applications")  # ruff:ignore[os-path-expanduser, os-path-join]
+        return os.path.join(_expand_user("~/.local/share", self._env), "applications")  # ruff:ignore[os-path-join]
 
     @property
-    def _site_applications_dirs(self) -> list[str]:
-        return [os.path.join(p, "applications") for p in ["/usr/local/share", "/usr/share"]]  # ruff:ignore[os-path-join]
+    def _site_applications_dirs(self) -> tuple[str, ...]:
+        return _join_all(("/usr/local/share", "/usr/share"), "applications")
 
     @property
     def site_applications_dir(self) -> str:
@@ -182,14 +192,15 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         falls back to a temporary directory.
 
         """
+        uid = self._uid
         if sys.platform.startswith("openbsd"):
-            path = f"/tmp/run/user/{getuid()}"  # ruff:ignore[hardcoded-temp-file]
+            path = f"/tmp/run/user/{uid}"  # ruff:ignore[hardcoded-temp-file]
         elif sys.platform.startswith(("freebsd", "netbsd")):
-            path = f"/var/run/user/{getuid()}"
+            path = f"/var/run/user/{uid}"
         else:
-            path = f"/run/user/{getuid()}"
+            path = f"/run/user/{uid}"
         if not os.access(path, os.W_OK):
-            path = f"{gettempdir()}/runtime-{getuid()}"
+            path = f"{gettempdir()}/runtime-{uid}"
         return self._append_app_name_and_version(path)
 
     @property
@@ -214,17 +225,17 @@ class _UnixDefaults(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def site_data_path(self) -> Path:
         """Data path shared by users. Only return the first item, even if ``multipath`` is set to ``True``."""
-        return self._first_item_as_path_if_multipath(self.site_data_dir)
+        return self.site_data_paths[0]
 
     @property
     def site_config_path(self) -> Path:
         """Config path shared by users, returns the first item, even if ``multipath`` is set to ``True``."""
-        return self._first_item_as_path_if_multipath(self.site_config_dir)
+        return self.site_config_paths[0]
 
     @property
     def site_cache_path(self) -> Path:
         """Cache path shared by users. Only return the first item, even if ``multipath`` is set to ``True``."""
-        return self._first_item_as_path_if_multipath(self.site_cache_dir)
+        return self.site_cache_paths[0]
 
     def iter_config_dirs(self) -> Iterator[str]:
         """:yield: all user and site configuration directories."""
@@ -274,6 +285,66 @@ class Unix(XDGMixin, _UnixDefaults):
 
     """
 
+    @classmethod
+    def for_user(
+        cls,
+        user: struct_passwd | int | str,
+        *args: Any,  # ruff:ignore[any-type]
+        env: Mapping[str, str] | None = None,
+        **kwargs: Any,  # ruff:ignore[any-type]
+    ) -> Unix:
+        """Resolve directories for another user, e.g. from a daemon running as root that provisions them for everyone.
+
+        The directories follow the XDG layout under the user's home directory from the password database, and their
+        user id for the runtime directory and `use_site_for_root <platformdirs.api.PlatformDirsABC.use_site_for_root>`.
+        Nothing of the process's own environment is used, nor is any process forked or privilege switched.
+
+        .. code-block:: python
+
+            dirs = Unix.for_user("alice", "MyApp", env={"XDG_CACHE_HOME": "/scratch/alice"})
+
+        :param user: a :mod:`pwd` entry, which needs no further lookup, or the user id or name to look up.
+        :param args: constructor arguments, see :class:`~platformdirs.api.PlatformDirsABC`.
+        :param env: environment variables of the user, such as ``XDG_CACHE_HOME``, to apply over their home directory.
+        :param kwargs: constructor arguments, see :class:`~platformdirs.api.PlatformDirsABC`.
+        :raises KeyError: if there is no such user.
+
+        """
+        entry = _passwd(user)
+        dirs = cls(*args, env={"HOME": entry.pw_dir, **(env or {})}, **kwargs)
+        dirs._user_id = entry.pw_uid
+        return dirs
+
+    @classmethod
+    def for_users(
+        cls,
+        *args: Any,  # ruff:ignore[any-type]
+        users: Iterable[struct_passwd | int | str] | None = None,
+        env: Mapping[str, Mapping[str, str]] | None = None,
+        **kwargs: Any,  # ruff:ignore[any-type]
+    ) -> dict[str, Unix]:
+        """Resolve directories for many users at once, like :meth:`for_user` for each.
+
+        Without ``users``, the password database is read once, through :func:`pwd.getpwall`, rather than once per user.
+
+        :param args: constructor arguments, see :class:`~platformdirs.api.PlatformDirsABC`.
+        :param users: the users, as for :meth:`for_user`; every user in the password database when not given.
+        :param env: environment variables of each user, keyed on the user name, see :meth:`for_user`.
+        :param kwargs: constructor arguments, see :class:`~platformdirs.api.PlatformDirsABC`.
+        :returns: an instance per user, keyed on the user name
+        :raises KeyError: if one of ``users`` does not exist.
+
+        """
+        if users is None:
+            import pwd  # ruff:ignore[import-outside-top-level]  # not available on Windows
+
+            users = pwd.getpwall()
+        env = env or {}
+        return {
+            entry.pw_name: cls.for_user(entry, *args, env=env.get(entry.pw_name), **kwargs)
+            for entry in map(_passwd, users)
+        }
+
     @property
     def user_data_dir(self) -> str:
         """Data directory tied to the user, or site equivalent when root with ``use_site_for_root``."""
@@ -315,33 +386,54 @@ class Unix(XDGMixin, _UnixDefaults):
         return self.site_bin_dir if self._use_site else super().user_bin_dir
 
 
-def _get_user_media_dir(env_var: str, fallback_tilde_path: str) -> str:
-    if media_dir := _get_user_dirs_folder(env_var):
+def _passwd(user: struct_passwd | int | str) -> struct_passwd:
+    if not isinstance(user, (int, str)):
+        return user
+    import pwd  # ruff:ignore[import-outside-top-level]  # not available on Windows
+
+    return pwd.getpwuid(user) if isinstance(user, int) else pwd.getpwnam(user)
+
+
+def _get_user_media_dir(env_var: str, fallback_tilde_path: str, env: Mapping[str, str]) -> str:
+    if media_dir := _get_user_dirs_folder(env_var, env):
         return media_dir
-    return os.path.expanduser(fallback_tilde_path)  # ruff:ignore[os-path-expanduser]
+    return _expand_user(fallback_tilde_path, env)
 
 
-def _get_user_dirs_folder(key: str) -> str | None:
+def _get_user_dirs_folder(key: str, env: Mapping[str, str]) -> str | None:
     """Return directory from user-dirs.dirs config file.
 
     See https://freedesktop.org/wiki/Software/xdg-user-dirs/.
 
     """
-    config_home = os.environ.get("XDG_CONFIG_HOME", "").strip() or os.path.expanduser("~/.config")  # ruff:ignore[os-path-expanduser]
-    user_dirs_config_path = Path(config_home) / "user-dirs.dirs"
-    if user_dirs_config_path.exists():
-        parser = ConfigParser()
+    section = _derive(env, "user-dirs", partial(_read_user_dirs, env))
+    if section is None or key not in section:
+        return None
+
+    path = section[key].strip('"')
+    return path.replace("$HOME", _expand_user("~", env))
+
+
+def _user_dirs_path(env: Mapping[str, str]) -> str:
+    config_home = env.get("XDG_CONFIG_HOME", "").strip() or _expand_user("~/.config", env)
+    return os.path.join(config_home, "user-dirs.dirs")  # ruff:ignore[os-path-join]
 
-        with user_dirs_config_path.open() as stream:
-            parser.read_string(f"[top]\n{stream.read()}")
 
-        if key not in parser["top"]:
-            return None
+def _read_user_dirs(env: Mapping[str, str]) -> SectionProxy | None:
+    user_dirs_config_path = _user_dirs_path(env)
+    try:
+        stat = os.stat(user_dirs_config_path)  # ruff:ignore[os-stat]
+    except OSError:
+        return None
+    return _parse_user_dirs(user_dirs_config_path, stat.st_mtime_ns, stat.st_size)["top"]
 
-        path = parser["top"][key].strip('"')
-        return path.replace("$HOME", os.path.expanduser("~"))  # ruff:ignore[os-path-expanduser]
 
-    return None
+@_shared_cache(maxsize=8)
+def _parse_user_dirs(user_dirs_config_path: str, mtime_ns: int, size: int) -> ConfigParser:  # ruff:ignore[unused-function-argument]
+    """Parse a user-dirs.dirs file once per modification, keyed on its stat so an edit is picked up on the next lookup."""
+    parser = ConfigParser()
+    parser.read_string(f"[top]\n{Path(user_dirs_config_path).read_text()}")  # ruff:ignore[unspecified-encoding]
+    return parser
 
 
 __all__ = [
@@ -8,10 +8,10 @@ from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
-from .api import PlatformDirsABC
+from .api import PlatformDirsABC, _clear_at_fork, _compile_suffix, _expand_user, _join, _shared_cache
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
 # Not exposed by CPython; defined in the Windows SDK (shlobj_core.h)
 _KF_FLAG_DONT_VERIFY: Final[int] = 0x00004000
@@ -31,28 +31,36 @@ class Windows(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     def user_data_dir(self) -> str:
         r"""Data directory tied to the user, e.g. ``%USERPROFILE%\AppData\Local\$appauthor\$appname`` (not roaming) or ``%USERPROFILE%\AppData\Roaming\$appauthor\$appname`` (roaming)."""
         const = "CSIDL_APPDATA" if self.roaming else "CSIDL_LOCAL_APPDATA"
-        path = os.path.normpath(get_win_folder(const))
+        path = os.path.normpath(self._win_folder(const))
         return self._append_parts(path)
 
+    def _win_folder(self, csidl_name: str) -> str:
+        return get_win_folder(csidl_name) if self._env is os.environ else get_win_folder(csidl_name, self._env)
+
     def _append_parts(self, path: str, *, opinion_value: str | None = None) -> str:
-        params = []
-        if self.appname:
-            if self.appauthor is not False:
-                author = self.appauthor or self.appname
-                params.append(author)
-            params.append(self.appname)
-            if opinion_value is not None and self.opinion:
-                params.append(opinion_value)
-            if self.version:
-                params.append(self.version)
-        path = os.path.join(path, *params)  # ruff:ignore[os-path-join]
+        if not self.opinion:
+            opinion_value = None
+        key = (self.appname, self.appauthor, self.version, opinion_value)
+        if (suffix := self._suffixes.get(key)) is None:
+            params = []
+            if self.appname:
+                if self.appauthor is not False:
+                    author = self.appauthor or self.appname
+                    params.append(author)
+                params.append(self.appname)
+                if opinion_value is not None:
+                    params.append(opinion_value)
+                if self.version:
+                    params.append(self.version)
+            suffix = self._suffixes[key] = _compile_suffix(tuple(params))
+        path = _join(path, suffix)
         self._optionally_create_directory(path)
         return path
 
     @property
     def site_data_dir(self) -> str:
         r"""Data directory shared by users, e.g. ``C:\ProgramData\$appauthor\$appname``."""
-        path = os.path.normpath(get_win_folder("CSIDL_COMMON_APPDATA"))
+        path = os.path.normpath(self._win_folder("CSIDL_COMMON_APPDATA"))
         return self._append_parts(path)
 
     @property
@@ -68,13 +76,13 @@ class Windows(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_cache_dir(self) -> str:
         r"""Cache directory tied to the user (if opinionated with ``Cache`` folder within ``$appname``) e.g. ``%USERPROFILE%\AppData\Local\$appauthor\$appname\Cache\$version``."""
-        path = os.path.normpath(get_win_folder("CSIDL_LOCAL_APPDATA"))
+        path = os.path.normpath(self._win_folder("CSIDL_LOCAL_APPDATA"))
         return self._append_parts(path, opinion_value="Cache")
 
     @property
     def site_cache_dir(self) -> str:
         r"""Cache directory shared by users, e.g. ``C:\ProgramData\$appauthor\$appname\Cache\$version``."""
-        path = os.path.normpath(get_win_folder("CSIDL_COMMON_APPDATA"))
+        path = os.path.normpath(self._win_folder("CSIDL_COMMON_APPDATA"))
         return self._append_parts(path, opinion_value="Cache")
 
     @property
@@ -92,7 +100,7 @@ class Windows(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         """Log directory tied to the user, same as `user_data_dir` if not opinionated else ``Logs`` in it."""
         path = self.user_data_dir
         if self.opinion:
-            path = os.path.join(path, "Logs")  # ruff:ignore[os-path-join]
+            path = _join(path, "Logs")
             self._optionally_create_directory(path)
         return path
 
@@ -101,59 +109,59 @@ class Windows(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         """Log directory shared by users, same as `site_data_dir` if not opinionated else ``Logs`` in it."""
         path = self.site_data_dir
         if self.opinion:
-            path = os.path.join(path, "Logs")  # ruff:ignore[os-path-join]
+            path = _join(path, "Logs")
             self._optionally_create_directory(path)
         return path
 
     @property
     def user_documents_dir(self) -> str:
         r"""Documents directory tied to the user e.g. ``%USERPROFILE%\Documents``."""
-        return os.path.normpath(get_win_folder("CSIDL_PERSONAL"))
+        return os.path.normpath(self._win_folder("CSIDL_PERSONAL"))
 
     @property
     def user_downloads_dir(self) -> str:
         r"""Downloads directory tied to the user e.g. ``%USERPROFILE%\Downloads``."""
-        return os.path.normpath(get_win_folder("CSIDL_DOWNLOADS"))
+        return os.path.normpath(self._win_folder("CSIDL_DOWNLOADS"))
 
     @property
     def user_pictures_dir(self) -> str:
         r"""Pictures directory tied to the user e.g. ``%USERPROFILE%\Pictures``."""
-        return os.path.normpath(get_win_folder("CSIDL_MYPICTURES"))
+        return os.path.normpath(self._win_folder("CSIDL_MYPICTURES"))
 
     @property
     def user_videos_dir(self) -> str:
         r"""Videos directory tied to the user e.g. ``%USERPROFILE%\Videos``."""
-        return os.path.normpath(get_win_folder("CSIDL_MYVIDEO"))
+        return os.path.normpath(self._win_folder("CSIDL_MYVIDEO"))
 
     @property
     def user_music_dir(self) -> str:
         r"""Music directory tied to the user e.g. ``%USERPROFILE%\Music``."""
-        return os.path.normpath(get_win_folder("CSIDL_MYMUSIC"))
+        return os.path.normpath(self._win_folder("CSIDL_MYMUSIC"))
 
     @property
     def user_desktop_dir(self) -> str:
         r"""Desktop directory tied to the user, e.g. ``%USERPROFILE%\Desktop``."""
-        return os.path.normpath(get_win_folder("CSIDL_DESKTOPDIRECTORY"))
+        return os.path.normpath(self._win_folder("CSIDL_DESKTOPDIRECTORY"))
 
     @property
     def user_projects_dir(self) -> str:
         r"""Projects directory tied to the user, e.g. ``%USERPROFILE%\Projects``."""
-        return os.path.normpath(os.path.expanduser("~/Projects"))  # ruff:ignore[os-path-expanduser]
+        return os.path.normpath(_expand_user("~/Projects", self._env))
 
     @property
     def user_publicshare_dir(self) -> str:
         r"""Public share directory e.g. ``C:\Users\Public``."""
-        return os.path.normpath(os.environ.get("PUBLIC", str(Path("~").expanduser().parent / "Public")))
+        return os.path.normpath(self._env.get("PUBLIC", str(Path(_expand_user("~", self._env)).parent / "Public")))
 
     @property
     def user_templates_dir(self) -> str:
         r"""Templates directory tied to the user e.g. ``%APPDATA%\Microsoft\Windows\Templates``."""
-        return os.path.normpath(str(Path(get_win_folder("CSIDL_APPDATA")) / "Microsoft" / "Windows" / "Templates"))
+        return os.path.normpath(str(Path(self._win_folder("CSIDL_APPDATA")) / "Microsoft" / "Windows" / "Templates"))
 
     @property
     def user_fonts_dir(self) -> str:
         r"""Fonts directory tied to the user e.g. ``%LOCALAPPDATA%\Microsoft\Windows\Fonts``."""
-        return os.path.normpath(str(Path(get_win_folder("CSIDL_LOCAL_APPDATA")) / "Microsoft" / "Windows" / "Fonts"))
+        return os.path.normpath(str(Path(self._win_folder("CSIDL_LOCAL_APPDATA")) / "Microsoft" / "Windows" / "Fonts"))
 
     @property
     def user_preference_dir(self) -> str:
@@ -163,27 +171,27 @@ class Windows(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
     @property
     def user_bin_dir(self) -> str:
         r"""Bin directory tied to the user, e.g. ``%LOCALAPPDATA%\Programs``."""
-        return os.path.normpath(os.path.join(get_win_folder("CSIDL_LOCAL_APPDATA"), "Programs"))  # ruff:ignore[os-path-join]
+        return os.path.normpath(os.path.join(self._win_folder("CSIDL_LOCAL_APPDATA"), "Programs"))  # ruff:ignore[os-path-join]
 
     @property
     def site_bin_dir(self) -> str:
         r"""Bin directory shared by users, e.g. ``C:\ProgramData\bin``."""
-        return os.path.normpath(os.path.join(get_win_folder("CSIDL_COMMON_APPDATA"), "bin"))  # ruff:ignore[os-path-join]
+        return os.path.normpath(os.path.join(self._win_folder("CSIDL_COMMON_APPDATA"), "bin"))  # ruff:ignore[os-path-join]
 
     @property
     def user_applications_dir(self) -> str:
         r"""Applications directory tied to the user, e.g. ``Start Menu\Programs``."""
-        return os.path.normpath(get_win_folder("CSIDL_PROGRAMS"))
+        return os.path.normpath(self._win_folder("CSIDL_PROGRAMS"))
 
     @property
     def site_applications_dir(self) -> str:
         r"""Applications directory shared by users, e.g. ``C:\ProgramData\Microsoft\Windows\Start Menu\Programs``."""
-        return os.path.normpath(get_win_folder("CSIDL_COMMON_PROGRAMS"))
+        return os.path.normpath(self._win_folder("CSIDL_COMMON_PROGRAMS"))
 
     @property
     def user_runtime_dir(self) -> str:
         r"""Runtime directory tied to the user, e.g. ``%USERPROFILE%\AppData\Local\Temp\$appauthor\$appname``."""
-        path = os.path.normpath(os.path.join(get_win_folder("CSIDL_LOCAL_APPDATA"), "Temp"))  # ruff:ignore[os-path-join]
+        path = os.path.normpath(os.path.join(self._win_folder("CSIDL_LOCAL_APPDATA"), "Temp"))  # ruff:ignore[os-path-join]
         return self._append_parts(path)
 
     @property
@@ -192,9 +200,9 @@ class Windows(PlatformDirsABC):  # ruff:ignore[too-many-public-methods]
         return self.user_runtime_dir
 
 
-def get_win_folder_from_env_vars(csidl_name: str) -> str:
-    """Get folder from environment variables."""
-    result = get_win_folder_if_csidl_name_not_env_var(csidl_name)
+def get_win_folder_from_env_vars(csidl_name: str, env: Mapping[str, str] = os.environ) -> str:
+    """Get folder from environment variables, read from ``env``."""
+    result = get_win_folder_if_csidl_name_not_env_var(csidl_name, env)
     if result is not None:
         return result
 
@@ -206,36 +214,38 @@ def get_win_folder_from_env_vars(csidl_name: str) -> str:
     if env_var_name is None:
         msg = f"Unknown CSIDL name: {csidl_name}"
         raise ValueError(msg)
-    result = os.environ.get(env_var_name)
+    result = env.get(env_var_name)
     if result is None:
         msg = f"Unset environment variable: {env_var_name}"
         raise ValueError(msg)
     return result
 
 
-def get_win_folder_if_csidl_name_not_env_var(csidl_name: str) -> str | None:  # ruff:ignore[too-many-return-statements]
-    """Get a folder for a CSIDL name that does not exist as an environment variable."""
+def get_win_folder_if_csidl_name_not_env_var(  # ruff:ignore[too-many-return-statements]
+    csidl_name: str, env: Mapping[str, str] = os.environ
+) -> str | None:
+    """Get a folder for a CSIDL name that does not exist as an environment variable, reading ``env``."""
     if csidl_name == "CSIDL_PERSONAL":
-        return os.path.join(os.path.normpath(os.environ["USERPROFILE"]), "Documents")  # ruff:ignore[os-path-join]
+        return os.path.join(os.path.normpath(env["USERPROFILE"]), "Documents")  # ruff:ignore[os-path-join]
 
     if csidl_name == "CSIDL_DOWNLOADS":
-        return os.path.join(os.path.normpath(os.environ["USERPROFILE"]), "Downloads")  # ruff:ignore[os-path-join]
+        return os.path.join(os.path.normpath(env["USERPROFILE"]), "Downloads")  # ruff:ignore[os-path-join]
 
     if csidl_name == "CSIDL_MYPICTURES":
-        return os.path.join(os.path.normpath(os.environ["USERPROFILE"]), "Pictures")  # ruff:ignore[os-path-join]
+        return os.path.join(os.path.normpath(env["USERPROFILE"]), "Pictures")  # ruff:ignore[os-path-join]
 
     if csidl_name == "CSIDL_MYVIDEO":
-        return os.path.join(os.path.normpath(os.environ["USERPROFILE"]), "Videos")  # ruff:ignore[os-path-join]
+        return os.path.join(os.path.normpath(env["USERPROFILE"]), "Videos")  # ruff:ignore[os-path-join]
 
     if csidl_name == "CSIDL_MYMUSIC":
-        return os.path.join(os.path.normpath(os.environ["USERPROFILE"]), "Music")  # ruff:ignore[os-path-join]
+        return os.path.join(os.path.normpath(env["USERPROFILE"]), "Music")  # ruff:ignore[os-path-join]
 
     if csidl_name == "CSIDL_DESKTOPDIRECTORY":
-        return os.path.join(os.path.normpath(os.environ["USERPROFILE"]), "Desktop")  # ruff:ignore[os-path-join]
+        return os.path.join(os.path.normpath(env["USERPROFILE"]), "Desktop")  # ruff:ignore[os-path-join]
 
     if csidl_name == "CSIDL_PROGRAMS":
         return os.path.join(  # ruff:ignore[os-path-join]
-            os.path.normpath(os.environ["APPDATA"]),
+            os.path.normpath(env["APPDATA"]),
             "Microsoft",
             "Windows",
             "Start Menu",
@@ -244,7 +254,7 @@ def get_win_folder_if_csidl_name_not_env_var(csidl_name: str) -> str | None:  #
 
     if csidl_name == "CSIDL_COMMON_PROGRAMS":
         return os.path.join(  # ruff:ignore[os-path-join]
-            os.path.normpath(os.environ.get("PROGRAMDATA", os.environ.get("ALLUSERSPROFILE", "C:\\ProgramData"))),
+            os.path.normpath(env.get("PROGRAMDATA", env.get("ALLUSERSPROFILE", "C:\\ProgramData"))),
             "Microsoft",
             "Windows",
             "Start Menu",
@@ -401,18 +411,42 @@ def _pick_get_win_folder() -> Callable[[str], str]:
         return get_win_folder_from_registry
 
 
-_resolve_win_folder = _pick_get_win_folder()
+def _cache_known_folders(resolver: Callable[[str], str]) -> Callable[[str], str]:
+    """Share shell and registry lookups across all instances; the environment fallback stays live since it reads env vars.
+
+    Known folders belong to the user the process runs as, so the cache starts empty in a forked child.
+
+    """
+    return resolver if resolver is get_win_folder_from_env_vars else _clear_at_fork(_shared_cache(maxsize=64)(resolver))
+
+
+_resolve_win_folder = _cache_known_folders(_pick_get_win_folder())
+
+
+def clear_known_folders() -> None:
+    """Forget the known folders looked up through the shell or the registry, so the next access looks them up again.
+
+    The lookups are shared by every instance for the life of the process, and
+    `refresh <platformdirs.api.PlatformDirsABC.refresh>` does not notice a known folder, such as Documents, relocated in
+    the meantime; call this once one was.
+
+    """
+    if (cache_clear := getattr(_resolve_win_folder, "cache_clear", None)) is not None:
+        cache_clear()
 
 
-def get_win_folder(csidl_name: str) -> str:
+def get_win_folder(csidl_name: str, env: Mapping[str, str] = os.environ) -> str:
     """Get a Windows folder path, checking for ``WIN_PD_OVERRIDE_*`` environment variable overrides first.
 
-    For example, ``CSIDL_LOCAL_APPDATA`` can be overridden by setting ``WIN_PD_OVERRIDE_LOCAL_APPDATA``.
+    For example, ``CSIDL_LOCAL_APPDATA`` can be overridden by setting ``WIN_PD_OVERRIDE_LOCAL_APPDATA``. Overrides, and
+    the environment variable fallback used when neither the shell nor the registry is available, are read from ``env``.
 
     """
     env_var = f"WIN_PD_OVERRIDE_{csidl_name.removeprefix('CSIDL_')}"
-    if override := os.environ.get(env_var, "").strip():
+    if override := env.get(env_var, "").strip():
         return override
+    if _resolve_win_folder is get_win_folder_from_env_vars:
+        return get_win_folder_from_env_vars(csidl_name, env)
     return _resolve_win_folder(csidl_name)
 
 
@@ -190,3 +190,11 @@ def test_android_ensure_exists_creates_opinion_subdir(
     expected = str(cache_dir / "myapp" / subdir)
     assert result == expected
     assert Path(result).is_dir()
+
+
+def test_android_unique_dirs_drop_shared_site_dir(mocker: MockerFixture) -> None:
+    mocker.patch("platformdirs.android._android_folder", return_value="/data/data/com.example", autospec=True)
+    dirs = Android("foo")
+    assert list(dirs.iter_config_dirs()) == [dirs.user_config_dir] * 2
+    assert dirs.unique_dirs("config") == (dirs.user_config_dir,)
+    assert dirs.unique_dirs("config") is dirs.unique_dirs("config")
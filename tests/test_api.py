@@ -1,16 +1,38 @@
 from __future__ import annotations
 
+import asyncio
 import builtins
+import copy
 import functools
 import inspect
+import os
+import pickle  # ruff:ignore[suspicious-pickle-import]
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
 import platformdirs
-from platformdirs.android import Android
+from platformdirs import api
+from platformdirs.android import Android, _android_folder
+from platformdirs.api import (
+    _FINGERPRINT_PREFIXES,
+    _FINGERPRINT_VARS,
+    _INTERN_MAXSIZE,
+    DirKind,
+    DirsConfig,
+    PlatformDirsABC,
+    _expand_user,
+    _join,
+    _shared_cache,
+    _SharedCache,
+)
+from platformdirs.macos import MacOS
+from platformdirs.unix import Unix
+from platformdirs.windows import Windows
 
 builtin_import = builtins.__import__
 
@@ -19,6 +41,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
     from types import ModuleType
 
+    from pytest_mock import MockerFixture
+
 
 def test_package_metadata() -> None:
     assert hasattr(platformdirs, "__version__")
@@ -134,6 +158,48 @@ def test_no_ctypes(func: str) -> None:
     assert isinstance(result, str)
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="home directory comes from USERPROFILE on Windows")
+def test_base_dirs_follow_home(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setenv("HOME", "/home/first")
+    first = platformdirs.PlatformDirs("MyApp").user_cache_dir
+    monkeypatch.setenv("HOME", "/home/second")
+    second = platformdirs.PlatformDirs("MyApp").user_cache_dir
+    assert first.startswith("/home/first")
+    assert second.startswith("/home/second")
+
+
+@pytest.mark.parametrize(
+    ("base", "suffix"),
+    [
+        pytest.param("/base", "app", id="plain"),
+        pytest.param("/base/", "app", id="trailing_sep"),
+        pytest.param("", "app", id="empty_base"),
+        pytest.param("/base", "/abs/app", id="absolute_suffix"),
+        pytest.param("C:", "app", id="drive"),
+        pytest.param("/base", "C:app", id="drive_suffix"),
+    ],
+)
+def test_join_matches_os_path_join(base: str, suffix: str) -> None:
+    expected = os.path.join(base, suffix)  # ruff:ignore[os-path-join]
+    assert _join(base, suffix) == expected
+
+
+def test_join_empty_suffix_keeps_base() -> None:
+    assert _join("/base", "") == "/base"
+
+
+def test_suffix_follows_attribute_change() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", version="1.0")
+    before = dirs.user_data_dir
+    dirs.appname = "Other"
+    dirs.version = None
+    after = dirs.user_data_dir
+    assert before.endswith(os.path.join("MyApp", "1.0"))  # ruff:ignore[os-path-join]
+    assert after.endswith("Other")
+    assert after != before
+
+
 def test_mypy_subclassing() -> None:
     # Ensure that PlatformDirs / AppDirs is seen as a valid superclass by mypy
     # This is a static type-checking test to ensure we work around
@@ -141,3 +207,543 @@ def test_mypy_subclassing() -> None:
     class PlatformDirsSubclass(platformdirs.PlatformDirs): ...
 
     class AppDirsSubclass(platformdirs.AppDirs): ...
+
+
+@pytest.mark.parametrize("kind", ["data", "config", "cache", "applications"])
+def test_site_dirs_tuple_single_path_platform(mocker: MockerFixture, kind: str) -> None:
+    mocker.patch("platformdirs.android._android_folder", return_value="/data/data/com.example")
+    dirs = Android("foo")
+    assert getattr(dirs, f"site_{kind}_dirs") == (getattr(dirs, f"site_{kind}_dir"),)
+    assert getattr(dirs, f"site_{kind}_paths") == (getattr(dirs, f"site_{kind}_path"),)
+
+
+def test_get_matches_property(func: str) -> None:
+    scope, kind, _ = func.split("_")
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    assert dirs.get(platformdirs.DirKind(kind), platformdirs.Scope(scope)) == getattr(dirs, func)
+    assert dirs.get(kind, scope, as_path=True) == getattr(dirs, func.replace("_dir", "_path"))
+
+
+def test_get_defaults_to_user_scope() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    assert dirs.get(platformdirs.DirKind.CACHE) == dirs.user_cache_dir
+
+
+@pytest.mark.parametrize(
+    ("kind", "scope", "message"),
+    [
+        pytest.param(platformdirs.DirKind.DOCUMENTS, platformdirs.Scope.SITE, "no site documents directory", id="site"),
+        pytest.param("temp", "user", "no user temp directory", id="kind"),
+        pytest.param("data", "group", "no group data directory", id="scope"),
+    ],
+)
+def test_get_invalid(kind: str, scope: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        platformdirs.PlatformDirs("MyApp").get(kind, scope)
+
+
+def test_resolve_all_matches_properties(props: tuple[str, ...]) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    resolved = dirs.resolve_all()
+    assert set(resolved) == set(props)
+    assert resolved == {prop: getattr(dirs, prop) for prop in props}
+
+
+def test_resolve_all_creates_nothing(tmp_path: Path) -> None:
+    env = {"HOME": str(tmp_path / "home"), "XDG_RUNTIME_DIR": str(tmp_path / "run")}
+    env |= {"XDG_DATA_DIRS": str(tmp_path / "site-data"), "XDG_CONFIG_DIRS": str(tmp_path / "site-config")}
+    dirs = Unix("MyApp", env=env, ensure_exists=True)
+    dirs.resolve_all()
+    dirs.env_dependencies()
+    dirs.refresh()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_path_property_reuses_path_object(func_path: str) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    assert getattr(dirs, func_path) is getattr(dirs, func_path)
+    assert getattr(dirs, func_path) is getattr(
+        platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0"), func_path
+    )
+
+
+def test_path_property_follows_directory_change(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    before = dirs.user_data_path
+    monkeypatch.setattr(type(dirs), "user_data_dir", property(lambda _: str(tmp_path)))
+    assert dirs.user_data_path == tmp_path
+    assert dirs.user_data_path is not before
+
+
+def test_dirpaths_return_dirpath(func: str) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    result = getattr(dirs.dirpaths, func)
+    assert isinstance(result, platformdirs.DirPath)
+    assert result == getattr(dirs, func)
+    assert result.path is getattr(dirs, func.replace("_dir", "_path"))
+
+
+def test_dirpath_behaves_as_str(tmp_path: Path) -> None:
+    directory = platformdirs.DirPath(tmp_path)
+    assert os.path.isdir(directory)  # ruff:ignore[os-path-isdir]
+    assert os.fspath(directory) == str(tmp_path)
+    assert directory.path is directory.path
+    assert directory.path == tmp_path
+
+
+def test_dirpath_join() -> None:
+    joined = platformdirs.DirPath("/base") / "key"
+    assert isinstance(joined, platformdirs.DirPath)
+    assert joined == os.path.join("/base", "key")  # ruff:ignore[os-path-join]
+    assert joined / Path("more") == os.path.join("/base", "key", "more")  # ruff:ignore[os-path-join]
+
+
+def test_dirpaths_get() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    assert dirs.dirpaths.get("log", "site") == dirs.site_log_dir
+
+
+def test_dirpaths_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="'DirPaths' object has no attribute 'user_data_path'"):
+        platformdirs.PlatformDirs("MyApp").dirpaths.user_data_path  # ruff:ignore[useless-expression]
+
+
+@pytest.mark.parametrize("prop", ["user_data_dir", "user_cache_dir", "user_log_dir", "site_config_dir"])
+def test_resolved_paths_are_shared_across_instances(prop: str) -> None:
+    first = getattr(platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0"), prop)
+    second = getattr(platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0"), prop)
+    assert first is second
+
+
+def test_shared_paths_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    interned: dict[str, str] = {}
+    monkeypatch.setattr(api, "_interned", interned)
+    paths = [_join("/srv", f"svc-{index}") for index in range(_INTERN_MAXSIZE + 10)]
+    assert 0 < len(interned) <= _INTERN_MAXSIZE
+    assert _join("/srv", "svc-1") == paths[1]
+
+
+def test_instances_keep_identity_semantics() -> None:
+    first = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    second = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    assert first != second
+    assert len({first, second}) == 2
+
+
+def test_equal_configuration_is_equal_and_hashes_alike() -> None:
+    first = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0").config()
+    second = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0").config()
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+
+
+def test_config_is_a_snapshot() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    config = dirs.config()
+    dirs.appname = "Other"
+    assert config.appname == "MyApp"
+    assert dirs.config() != config
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"appname": "Other"}, id="appname"),
+        pytest.param({"version": "2.0"}, id="version"),
+        pytest.param({"roaming": True}, id="roaming"),
+        pytest.param({"ensure_exists": True}, id="ensure_exists"),
+    ],
+)
+def test_different_configuration_is_unequal(kwargs: dict[str, Any]) -> None:
+    params: dict[str, Any] = {"appname": "MyApp", "version": "1.0"}
+    assert platformdirs.PlatformDirs(**params).config() != platformdirs.PlatformDirs(**{**params, **kwargs}).config()
+
+
+def test_different_platform_is_unequal() -> None:
+    assert Android("MyApp").config() != Unix("MyApp").config()
+
+
+def test_config_usable_as_lru_cache_argument() -> None:
+    calls = []
+
+    @functools.lru_cache
+    def resolve(config: DirsConfig) -> str:
+        calls.append(config)
+        return config.create().user_data_dir
+
+    assert resolve(platformdirs.PlatformDirs("MyApp").config()) == platformdirs.PlatformDirs("MyApp").user_data_dir
+    resolve(platformdirs.PlatformDirs("MyApp").config())
+    assert len(calls) == 1
+
+
+def test_config_creates_alike_instance() -> None:
+    dirs = _Tenant("a")
+    dirs.version = "1.0"
+    created = dirs.config().create()
+    assert type(created) is _Tenant
+    assert created.config() == dirs.config()
+    assert created.user_data_dir == dirs.user_data_dir
+
+
+def test_repr_round_trips() -> None:
+    dirs = Android("MyApp", False, "1.0", opinion=False)
+    assert repr(dirs) == (
+        "Android(appname='MyApp', appauthor=False, version='1.0', roaming=False, multipath=False, opinion=False, "
+        "ensure_exists=False, use_site_for_root=False)"
+    )
+    assert eval(repr(dirs), {"Android": Android}).config() == dirs.config()  # ruff:ignore[suspicious-eval-usage]
+
+
+def test_pickle_round_trip_is_compact() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    data = pickle.dumps(dirs)
+    assert len(data) < len(pickle.dumps(dirs.__dict__)) + len(type(dirs).__qualname__)
+    assert b"use_site_for_root" not in data
+    restored = pickle.loads(data)  # ruff:ignore[suspicious-pickle-usage]
+    assert type(restored) is type(dirs)
+    assert restored.config() == dirs.config()
+    assert restored.user_data_dir == dirs.user_data_dir
+
+
+def test_pickle_leaves_out_refresh_results() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    before = pickle.dumps(dirs)
+    dirs.refresh()
+    data = pickle.dumps(dirs)
+    assert len(data) == len(before)
+    assert b"_resolution" not in data
+    restored = pickle.loads(data)  # ruff:ignore[suspicious-pickle-usage]
+    assert "_resolution" not in restored.__dict__
+    assert restored.refresh() == dirs.refresh()
+
+
+def test_pickle_keeps_input_keyed_caches() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", appauthor=False, ensure_exists=False)
+    dirs.unique_dirs("config")
+    restored = pickle.loads(pickle.dumps(dirs))  # ruff:ignore[suspicious-pickle-usage]
+    assert restored.__dict__["_unique"] == dirs.__dict__["_unique"]
+    assert "_use_site" not in restored.__dict__
+    assert restored.appauthor is False
+
+
+class _Tenant(Unix):
+    def __init__(self, tenant: str) -> None:
+        super().__init__(f"svc-{tenant}")
+        self.tenant = tenant
+
+
+def test_pickle_subclass_with_own_signature() -> None:
+    restored = pickle.loads(pickle.dumps(_Tenant("a")))  # ruff:ignore[suspicious-pickle-usage]
+    assert restored.tenant == "a"
+    assert restored.appname == "svc-a"
+
+
+def test_copy_keeps_caches() -> None:
+    dirs = Unix("MyApp")
+    dirs.unique_dirs("data")
+    assert copy.copy(dirs).__dict__ == dirs.__dict__
+
+
+def test_env_defaults_to_process_environment() -> None:
+    assert Unix().env is os.environ
+    assert Unix(env=os.environ).__dict__.get("_env") is None
+
+
+def test_env_takes_part_in_config() -> None:
+    env = {"HOME": "/home/a"}
+    assert Unix("MyApp", env=env).config() == Unix("MyApp", env=dict(env)).config()
+    assert Unix("MyApp", env=env).config() != Unix("MyApp").config()
+    assert Unix("MyApp", env=env).config() != Unix("MyApp", env={"HOME": "/home/b"}).config()
+    assert Unix("MyApp").config().env is None
+
+
+def test_env_repr_hides_values() -> None:
+    dirs = Unix("MyApp", env={"HOME": "/home/a", "API_TOKEN": "secret"})
+    assert repr(dirs).endswith(", use_site_for_root=False, env=<2 variables>)")
+    assert "secret" not in repr(dirs)
+    assert "API_TOKEN" not in repr(dirs.child("plugin"))
+
+
+def test_env_pickle_round_trip() -> None:
+    dirs = Unix("MyApp", env={"HOME": "/home/a"})
+    restored = pickle.loads(pickle.dumps(dirs))  # ruff:ignore[suspicious-pickle-usage]
+    assert restored.config() == dirs.config()
+    assert restored.user_data_dir == dirs.user_data_dir
+
+
+def test_fingerprint_tracks_relevant_variables(monkeypatch: pytest.MonkeyPatch) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    before = dirs.fingerprint()
+    monkeypatch.setenv("UNRELATED_VARIABLE", "1")
+    assert dirs.fingerprint() == before
+    monkeypatch.setenv("XDG_CACHE_HOME", "/elsewhere")
+    assert dirs.fingerprint() != before
+
+
+def test_fingerprint_tracks_sys_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    before = dirs.fingerprint()
+    monkeypatch.setattr(sys, "prefix", "/opt/homebrew/opt/python")
+    assert dirs.fingerprint() != before
+
+
+def test_refresh_resolves_only_on_change(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    dirs = Unix("MyApp")
+    resolve = mocker.spy(dirs, "_resolve")
+    first = dirs.refresh()
+    assert dirs.refresh() == first
+    assert resolve.call_count == 1
+    monkeypatch.setenv("XDG_CACHE_HOME", "/elsewhere")
+    assert dirs.refresh() == {**first, "user_cache_dir": "/elsewhere/MyApp"}
+    assert resolve.call_count == 2
+    assert [name for name, _ in resolve.call_args.args[0]] == ["user_cache_dir"]
+
+
+def test_refresh_follows_attribute_changes() -> None:
+    dirs = Unix("A", env={"HOME": "/h"})
+    assert dirs.refresh()["user_data_dir"] == "/h/.local/share/A"
+    dirs.appname = "B"
+    assert dirs.refresh()["user_data_dir"] == "/h/.local/share/B"
+    dirs.version = "1.0"
+    assert dirs.refresh() == dirs.resolve_all()
+
+
+def test_env_dependencies_follow_branch_taken(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    dirs = Unix("MyApp")
+    assert dirs.env_dependencies()["user_cache_dir"] == {"XDG_CACHE_HOME", "HOME"}
+    assert dirs.env_dependencies()["site_cache_dir"] == frozenset()
+    monkeypatch.setenv("XDG_CACHE_HOME", "/elsewhere")
+    assert dirs.env_dependencies()["user_cache_dir"] == {"XDG_CACHE_HOME"}
+
+
+@pytest.mark.parametrize("cls", [Unix, Android, MacOS, Windows])
+def test_env_dependencies_are_fingerprinted(mocker: MockerFixture, cls: type[PlatformDirsABC]) -> None:
+    mocker.patch("platformdirs.android._android_folder", return_value="/data/data/com.example")
+    folders = ["APPDATA", "LOCAL_APPDATA", "COMMON_APPDATA", "PERSONAL", "DOWNLOADS", "MYPICTURES", "MYVIDEO"]
+    folders += ["MYMUSIC", "DESKTOPDIRECTORY", "PROGRAMS", "COMMON_PROGRAMS"]
+    env = {"HOME": "/home/a", **{f"WIN_PD_OVERRIDE_{folder}": f"C:\\{folder}" for folder in folders}}
+    dirs = cls("MyApp", env=env)
+    assert dirs.env_dependencies().keys() == dirs.resolve_all().keys()
+    for name, variables in dirs.env_dependencies().items():
+        assert all(var in _FINGERPRINT_VARS or var.startswith(_FINGERPRINT_PREFIXES) for var in variables), name
+
+
+def test_refresh_returns_a_copy() -> None:
+    dirs = Unix("MyApp")
+    dirs.refresh()["user_cache_dir"] = "changed"
+    assert dirs.refresh()["user_cache_dir"] == dirs.user_cache_dir
+
+
+def test_process_probes_clear_at_fork() -> None:
+    assert _android_folder.cache_clear in api._FORK_LOCAL_CACHES  # ruff:ignore[private-member-access]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_child_probes_again(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    probes: list[int] = []
+    probe = _shared_cache(maxsize=1)(lambda: probes.append(os.getpid()) or len(probes))
+    monkeypatch.setattr(api, "_FORK_LOCAL_CACHES", [probe.cache_clear])
+    getuid = mocker.patch("platformdirs.unix.getuid", return_value=0)
+    assert probe() == 1
+    dirs = Unix("foo", use_site_for_root=True, env={"XDG_DATA_HOME": "/home/worker/.local/share"})
+    assert dirs.user_data_dir == "/usr/local/share/foo"
+    read, write = os.pipe()
+    if (pid := os.fork()) == 0:  # pragma: no cover  # runs in the child
+        report = "failed"
+        try:
+            getuid.return_value = 1000  # the worker drops privileges
+            report = f"{probe()} {dirs.user_data_dir}"
+        finally:
+            os.write(write, report.encode())
+            os._exit(0)
+    os.close(write)
+    with os.fdopen(read) as pipe:
+        report = pipe.read()
+    os.waitpid(pid, 0)
+    assert report == "2 /home/worker/.local/share/foo"
+    assert probe() == 1
+
+
+@pytest.mark.parametrize("maxsize", [1, 3])
+def test_shared_cache(maxsize: int) -> None:
+    calls: list[str] = []
+    cached = _SharedCache(lambda value: calls.append(value) or value.upper(), maxsize)
+    assert [cached(value) for value in "abcabc"] == list("ABCABC")
+    assert len(calls) == (6 if maxsize == 1 else 3)
+    cached.cache_clear()
+    assert cached("a") == "A"
+    assert len(calls) == (7 if maxsize == 1 else 4)
+
+
+def test_aensure_creates_off_the_loop(mocker: MockerFixture, tmp_path: Path) -> None:
+    env = {"HOME": str(tmp_path), "XDG_CACHE_HOME": str(tmp_path / "cache"), "XDG_STATE_HOME": str(tmp_path / "state")}
+    dirs = Unix("MyApp", env=env, ensure_exists=True)
+    threads: list[threading.Thread] = []
+    mkdir = Path.mkdir
+
+    def record(path: Path, mode: int = 0o777, parents: bool = False, exist_ok: bool = False) -> None:
+        threads.append(threading.current_thread())
+        mkdir(path, mode, parents, exist_ok)
+
+    mocker.patch.object(Path, "mkdir", record)
+    created = asyncio.run(dirs.aensure("cache", DirKind.LOG))
+    assert created == [tmp_path / "cache" / "MyApp", tmp_path / "state" / "MyApp" / "log"]
+    assert all(path.is_dir() for path in created)
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_aensure_every_site_location(tmp_path: Path) -> None:
+    env = {"XDG_DATA_DIRS": os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])}
+    dirs = Unix("MyApp", env=env, multipath=True)
+    (created,) = asyncio.run(dirs.aensure("data", scope="site"))
+    assert created == dirs.site_data_path
+    assert (tmp_path / "a" / "MyApp").is_dir()
+    assert (tmp_path / "b" / "MyApp").is_dir()
+
+
+def test_site_locations_keep_entries_with_separator(tmp_path: Path) -> None:
+    env = {"XDG_DATA_DIRS": os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])}
+    name = f"svc{os.pathsep}1"
+    dirs = Unix(name, env=env, multipath=True)
+    asyncio.run(dirs.aensure("data", scope="site"))
+    assert sorted(path.name for path in (tmp_path / "a").iterdir()) == [name]
+    assert (tmp_path / "b" / name).is_dir()
+    assert dirs.child("plugin").site_data_dir == os.pathsep.join([
+        str(tmp_path / "a" / name / "plugin"),
+        str(tmp_path / "b" / name / "plugin"),
+    ])
+
+
+def test_aensure_unknown_directory() -> None:
+    with pytest.raises(ValueError, match="no site documents directory"):
+        asyncio.run(platformdirs.PlatformDirs("MyApp").aensure("documents", scope="site"))
+
+
+@pytest.mark.parametrize("threads", [1, 4, 16, 64])
+def test_resolution_from_many_threads(threads: int) -> None:
+    tenants = [platformdirs.PlatformDirs(f"svc-{index}", version="1.0") for index in range(8)]
+    expected = [(dirs.resolve_all(), dirs.user_cache_path, dirs.site_data_paths) for dirs in tenants]
+    barrier = threading.Barrier(threads)
+
+    def resolve(worker: int) -> bool:
+        barrier.wait()
+        for step in range(50):
+            dirs = tenants[(worker + step) % len(tenants)]
+            if (dirs.resolve_all(), dirs.user_cache_path, dirs.site_data_paths) != expected[(worker + step) % 8]:
+                return False
+        return True
+
+    with ThreadPoolExecutor(threads) as pool:
+        assert all(pool.map(resolve, range(threads)))
+
+
+def test_shared_cache_from_many_threads() -> None:
+    cached = _SharedCache(str.upper, maxsize=16)
+    barrier = threading.Barrier(32)
+
+    def lookup(worker: int) -> list[str]:
+        barrier.wait()
+        return [cached(f"key-{(worker + step) % 40}") for step in range(200)]
+
+    with ThreadPoolExecutor(32) as pool:
+        for worker, results in enumerate(pool.map(lookup, range(32))):
+            assert results == [f"KEY-{(worker + step) % 40}" for step in range(200)]
+
+
+_RESOLVE_IN_INTERPRETER = """
+import sys
+sys.path[:0] = path.split(separator)
+import platformdirs
+dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+for _ in range(50):
+    resolved = dirs.resolve_all()
+results.put(repr(sorted(resolved.items())))
+"""
+
+
+def test_resolution_from_many_subinterpreters() -> None:
+    interpreters = pytest.importorskip("concurrent.interpreters")  # Python 3.14+
+    results = interpreters.create_queue()
+    workers = [interpreters.create() for _ in range(4)]
+    try:
+        for interp in workers:
+            interp.prepare_main(results=results, path=os.pathsep.join(sys.path), separator=os.pathsep)
+        threads = [threading.Thread(target=interp.exec, args=(_RESOLVE_IN_INTERPRETER,)) for interp in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        resolved = [results.get(timeout=30) for _ in workers]
+    finally:
+        for interp in workers:
+            interp.close()
+    expected = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0").resolve_all()
+    assert resolved == [repr(sorted(expected.items()))] * len(workers)
+
+
+@pytest.mark.parametrize("path", ["~", "~/", "~/.cache", "~//x", "/abs/path", "rel/~", "~root/x"])
+@pytest.mark.parametrize("home", ["/home/example", "/home/example/", "/", ""])
+def test_expand_user_matches_os_path_expanduser(monkeypatch: pytest.MonkeyPatch, path: str, home: str) -> None:
+    monkeypatch.setenv("HOME", home)
+    monkeypatch.setenv("USERPROFILE", home)
+    expected = os.path.expanduser(path)  # ruff:ignore[os-path-expanduser]
+    assert _expand_user(path) == expected
+    assert _expand_user(path, {"HOME": home, "USERPROFILE": home}) == expected
+
+
+def test_expand_user_reads_given_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", "/home/process")
+    monkeypatch.setenv("USERPROFILE", "/home/process")
+    env = {"HOME": "/home/worker", "USERPROFILE": "/home/worker"}
+    assert _expand_user("~/.cache", env) == "/home/worker/.cache"
+
+
+@pytest.mark.parametrize("prop", ["user_cache_dir", "user_log_dir", "site_config_dir", "user_runtime_dir"])
+def test_child_appends_segment(prop: str) -> None:
+    dirs = platformdirs.PlatformDirs("MyApp", "MyCompany", version="1.0")
+    child = dirs.child("plugin")
+    assert getattr(child, prop) == os.path.join(getattr(dirs, prop), "plugin")  # ruff:ignore[os-path-join]
+    assert getattr(child, prop.replace("_dir", "_path")) == Path(getattr(dirs, prop), "plugin")
+
+
+def test_child_nests() -> None:
+    dirs = platformdirs.PlatformDirs("MyApp")
+    assert dirs.child("a").child("b").user_data_dir == os.path.join(dirs.user_data_dir, "a", "b")  # ruff:ignore[os-path-join]
+
+
+def test_child_multipath(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_DATA_DIRS", os.pathsep.join(["/a", "/b"]))
+    child = Unix("MyApp", multipath=True).child("plugin")
+    expected = [os.path.join(base, "MyApp", "plugin") for base in ("/a", "/b")]  # ruff:ignore[os-path-join]
+    assert child.site_data_dir == os.pathsep.join(expected)
+    assert child.site_data_path == Path(expected[0])
+
+
+def test_child_creates_lazily(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Unix, "user_cache_dir", property(lambda _: str(tmp_path / "cache")))
+    child = Unix("MyApp").child("plugin", ensure_exists=True)
+    assert not (tmp_path / "cache").exists()
+    assert Path(child.user_cache_dir).is_dir()
+
+
+def test_child_inherits_ensure_exists() -> None:
+    assert Unix("MyApp", ensure_exists=True).child("plugin").ensure_exists is True
+    assert Unix("MyApp", ensure_exists=True).child("plugin", ensure_exists=False).ensure_exists is False
+
+
+@pytest.mark.parametrize("name", ["", ".", "..", "a/b"])
+def test_child_rejects_non_segment(name: str) -> None:
+    with pytest.raises(ValueError, match="single path segment"):
+        platformdirs.PlatformDirs("MyApp").child(name)
+
+
+def test_child_rejects_non_application_dir() -> None:
+    child = platformdirs.PlatformDirs("MyApp").child("plugin")
+    with pytest.raises(ValueError, match="no user documents directory for a child"):
+        child.get("documents")
+    with pytest.raises(AttributeError, match="'ChildDirs' object has no attribute 'user_documents_dir'"):
+        child.user_documents_dir  # ruff:ignore[useless-expression]
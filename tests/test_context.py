@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+import platformdirs
+from platformdirs import PlatformDirs, scoped
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_scoped_sets_defaults() -> None:
+    with scoped(appname="svc-a", version="1.0"):
+        assert platformdirs.user_data_dir() == PlatformDirs("svc-a", version="1.0").user_data_dir
+        assert platformdirs.user_cache_path() == PlatformDirs("svc-a", version="1.0").user_cache_path
+    assert platformdirs.user_data_dir() == PlatformDirs().user_data_dir
+
+
+def test_scoped_other_arguments_win() -> None:
+    with scoped(appname="svc-a", version="1.0"):
+        assert platformdirs.user_data_dir("svc-b") == PlatformDirs("svc-b", version="1.0").user_data_dir
+
+
+def test_scoped_applies_to_arguments_passed_at_default() -> None:
+    with scoped(appname="svc-a", opinion=False):
+        assert platformdirs.user_log_dir(opinion=True) == PlatformDirs("svc-a", opinion=False).user_log_dir
+        with scoped(opinion=True):
+            assert platformdirs.user_log_dir() == PlatformDirs("svc-a").user_log_dir
+
+
+def test_scoped_overrides(tmp_path: Path) -> None:
+    with scoped(appname="svc-a", overrides={"user_cache_dir": tmp_path}):
+        assert platformdirs.user_cache_dir() == str(tmp_path)
+        assert platformdirs.user_cache_path() == tmp_path
+        assert platformdirs.user_log_dir() == PlatformDirs("svc-a").user_log_dir
+
+
+def test_scoped_nests(tmp_path: Path) -> None:
+    with scoped(appname="svc-a", version="1.0", overrides={"user_cache_dir": tmp_path}):
+        with scoped(version="2.0"):
+            assert platformdirs.user_data_dir() == PlatformDirs("svc-a", version="2.0").user_data_dir
+            assert platformdirs.user_cache_path() == tmp_path
+        assert platformdirs.user_data_dir() == PlatformDirs("svc-a", version="1.0").user_data_dir
+
+
+def test_scoped_leaves_instances_alone() -> None:
+    with scoped(appname="svc-a"):
+        assert PlatformDirs().appname is None
+
+
+def test_scoped_resets_on_error() -> None:
+    with pytest.raises(RuntimeError), scoped(appname="svc-a"):
+        raise RuntimeError
+    assert platformdirs.user_data_dir() == PlatformDirs().user_data_dir
+
+
+def test_scoped_isolated_between_tasks() -> None:
+    async def tenant(name: str) -> str:
+        with scoped(appname=name):
+            await asyncio.sleep(0)
+            return platformdirs.user_data_dir()
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*(tenant(f"svc-{index}") for index in range(3)))
+
+    assert asyncio.run(main()) == [PlatformDirs(f"svc-{index}").user_data_dir for index in range(3)]
+
+
+@pytest.mark.parametrize(
+    ("params", "overrides", "match"),
+    [
+        pytest.param({"app": "svc-a"}, None, "unknown parameter", id="parameter"),
+        pytest.param({}, {"user_cache_path": "/srv"}, "unknown directory name", id="override"),
+    ],
+)
+def test_scoped_rejects_unknown_names(params: dict[str, object], overrides: dict[str, str] | None, match: str) -> None:
+    with pytest.raises(TypeError, match=match), scoped(overrides, **params):
+        pass
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from platformdirs import PlatformDirs, PlatformDirsFactory
+from platformdirs.factory import CacheInfo
+from platformdirs.unix import Unix
+
+
+def test_factory_reuses_instance() -> None:
+    factory = PlatformDirsFactory()
+    first = factory("svc-a", version="1.0")
+    assert factory("svc-a", version="1.0") is first
+    assert factory("svc-a", version="2.0") is not first
+    assert factory.cache_info() == CacheInfo(hits=1, misses=2, evictions=0, maxsize=1024, currsize=2)
+
+
+def test_factory_matches_direct_construction() -> None:
+    dirs = PlatformDirsFactory()("svc-a", "Acme", "1.0", roaming=True)
+    assert isinstance(dirs, PlatformDirs)
+    assert dirs.user_data_dir == PlatformDirs("svc-a", "Acme", "1.0", roaming=True).user_data_dir
+
+
+def test_factory_evicts_least_recently_used() -> None:
+    evicted: list[str | None] = []
+    factory = PlatformDirsFactory(2, on_evict=lambda dirs: evicted.append(dirs.appname))
+    factory("a")
+    factory("b")
+    factory("a")
+    factory("c")
+    assert evicted == ["b"]
+    assert len(factory) == 2
+    assert factory.cache_info().evictions == 1
+
+
+def test_factory_gives_new_instance_a_chance() -> None:
+    factory = PlatformDirsFactory(1)
+    factory("a")
+    factory("a")
+    assert factory("b").appname == "b"
+    assert len(factory) == 1
+    assert factory("b") is factory("b")
+
+
+def test_factory_from_many_threads() -> None:
+    factory = PlatformDirsFactory(8)
+    barrier = threading.Barrier(16)
+
+    def lookup(worker: int) -> bool:
+        barrier.wait()
+        return all(
+            factory(f"svc-{(worker + step) % 12}").appname == f"svc-{(worker + step) % 12}" for step in range(200)
+        )
+
+    with ThreadPoolExecutor(16) as pool:
+        assert all(pool.map(lookup, range(16)))
+    assert len(factory) == 8
+    info = factory.cache_info()
+    assert info.misses - info.evictions == 8
+
+
+def test_factory_unbounded() -> None:
+    factory = PlatformDirsFactory(None)
+    for tenant in range(100):
+        factory(f"svc-{tenant}")
+    assert factory.cache_info() == CacheInfo(hits=0, misses=100, evictions=0, maxsize=None, currsize=100)
+
+
+def test_factory_cache_clear() -> None:
+    factory = PlatformDirsFactory()
+    first = factory("a")
+    factory.cache_clear()
+    assert factory.cache_info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=1024, currsize=0)
+    assert factory("a") is not first
+
+
+def test_factory_keys_env_on_contents() -> None:
+    factory = PlatformDirsFactory()
+    first = factory("a", env={"HOME": "/home/a"})
+    assert factory("a", env={"HOME": "/home/a"}) is first
+    assert factory("a", env={"HOME": "/home/b"}) is not first
+    assert factory("a") is not first
+    assert first.env == {"HOME": "/home/a"}
+
+
+def test_factory_dirs_class() -> None:
+    assert isinstance(PlatformDirsFactory(dirs_class=Unix)("a"), Unix)
+
+
+@pytest.mark.parametrize("maxsize", [0, -1])
+def test_factory_rejects_invalid_maxsize(maxsize: int) -> None:
+    with pytest.raises(ValueError, match="maxsize must be at least 1"):
+        PlatformDirsFactory(maxsize)
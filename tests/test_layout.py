@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from platformdirs import DirKind, Layout, LayoutDir, Scope
+from platformdirs.unix import Unix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _AppLayout(Layout):
+    http = LayoutDir(DirKind.CACHE, "http")
+    thumbnails = LayoutDir(DirKind.CACHE, "thumbnails")
+    models = LayoutDir(DirKind.DATA, "models", "v3")
+    audit = LayoutDir("log", "audit")
+
+
+class _ExtendedLayout(_AppLayout):
+    db = LayoutDir(DirKind.STATE, "db")
+
+
+@pytest.fixture
+def dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Unix:
+    for var in ("XDG_CACHE_HOME", "XDG_DATA_HOME", "XDG_STATE_HOME"):
+        monkeypatch.setenv(var, str(tmp_path / var.lower()))
+    return Unix("MyApp")
+
+
+def test_layout_resolves_under_platform_dirs(dirs: Unix) -> None:
+    layout = _AppLayout(dirs)
+    assert layout.http == dirs.user_cache_path / "http"
+    assert layout.models == dirs.user_data_path / "models" / "v3"
+    assert layout.audit == dirs.user_log_path / "audit"
+
+
+def test_layout_caches_resolved_paths(dirs: Unix, monkeypatch: pytest.MonkeyPatch) -> None:
+    layout = _AppLayout(dirs)
+    first = layout.http
+    monkeypatch.setenv("XDG_CACHE_HOME", "/elsewhere")
+    assert layout.http is first
+    assert _AppLayout(dirs).http != first
+
+
+def test_layout_collects_inherited_dirs() -> None:
+    assert list(_AppLayout.layout_dirs) == ["http", "thumbnails", "models", "audit"]
+    assert list(_ExtendedLayout.layout_dirs) == ["http", "thumbnails", "models", "audit", "db"]
+    assert isinstance(_AppLayout.http, LayoutDir)
+
+
+def test_layout_paths(dirs: Unix) -> None:
+    assert _ExtendedLayout(dirs).paths()["db"] == dirs.user_state_path / "db"
+
+
+def test_layout_create(dirs: Unix, tmp_path: Path) -> None:
+    (tmp_path / "xdg_cache_home").mkdir()
+    layout = _ExtendedLayout(dirs)
+    created = layout.create()
+    assert all(path.is_dir() for path in layout.paths().values())
+    assert created.index(dirs.user_cache_path) < created.index(layout.http)
+    assert tmp_path / "xdg_cache_home" not in created
+    assert len(created) == len(set(created))
+    assert layout.create() == []
+
+
+def test_layout_dir_site_scope(dirs: Unix) -> None:
+    class SiteLayout(Layout):
+        shared = LayoutDir(DirKind.CONFIG, "shared", scope=Scope.SITE)
+
+    assert SiteLayout(dirs).shared == dirs.site_config_path / "shared"
+
+
+def test_layout_dir_rejects_unknown_dir() -> None:
+    with pytest.raises(ValueError, match="no site documents directory"):
+        LayoutDir(DirKind.DOCUMENTS, "x", scope=Scope.SITE)
@@ -170,6 +170,16 @@ def test_macos_homebrew(mocker: MockerFixture, params: dict[str, Any], multipath
         assert result == expected
 
 
+@pytest.mark.usefixtures("_clear_xdg_env")
+def test_macos_homebrew_site_dirs_tuple(mocker: MockerFixture) -> None:
+    mocker.patch("sys.prefix", "/opt/homebrew/opt/python@3.13/Frameworks/Python.framework/Versions/3.13")
+    dirs = MacOS(appname="foo")
+    assert dirs.site_cache_dirs == ("/opt/homebrew/var/cache/foo", "/Library/Caches/foo")
+    assert dirs.site_data_dirs == ("/opt/homebrew/share/foo", "/Library/Application Support/foo")
+    assert dirs.site_config_paths == (Path("/opt/homebrew/share/foo"), Path("/Library/Application Support/foo"))
+    assert dirs.site_applications_dirs == ("/Applications",)
+
+
 @pytest.mark.parametrize(
     ("env_var", "prop", "xdg_path"),
     [
@@ -428,8 +438,8 @@ def test_macos_site_runtime_path() -> None:
 
 
 @pytest.mark.usefixtures("_clear_xdg_env", "_builtin_py_prefix")
-def test_macos_ensure_exists_preexisting_dir(mocker: MockerFixture, tmp_path: Path) -> None:
-    mocker.patch("platformdirs.macos.os.path.expanduser", lambda p: str(tmp_path / p.lstrip("~/")))
+def test_macos_ensure_exists_preexisting_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
     dirs = MacOS(appname="foo", ensure_exists=True)
     first = dirs.user_data_dir
     assert Path(first).exists()
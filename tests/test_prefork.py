@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from platformdirs import PlatformDirs, PlatformDirsFactory, warmup
+from platformdirs.unix import Unix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_warmup_returns_instances_in_order() -> None:
+    given = PlatformDirs("svc-b")
+    warmed = warmup([{"appname": "svc-a", "version": "1.0"}, given])
+    assert warmed[1] is given
+    assert isinstance(warmed[0], PlatformDirs)
+    assert warmed[0].resolve_all() == PlatformDirs("svc-a", version="1.0").resolve_all()
+
+
+def test_warmup_through_factory() -> None:
+    factory = PlatformDirsFactory()
+    (dirs,) = warmup([{"appname": "svc-a"}], factory=factory)
+    assert factory("svc-a") is dirs
+
+
+def test_warmup_creates_directories(tmp_path: Path) -> None:
+    env = {
+        "HOME": str(tmp_path),
+        "XDG_DATA_HOME": str(tmp_path / "data"),
+        "XDG_CONFIG_HOME": str(tmp_path / "config"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        "XDG_RUNTIME_DIR": str(tmp_path / "run"),
+    }
+    dirs = Unix("svc-a", env=env)
+    warmup([dirs], scope="user", ensure_exists=True)
+    assert dirs.ensure_exists is False
+    assert dirs.user_data_path.is_dir()
+    assert dirs.user_config_path.is_dir()
+    assert dirs.user_cache_path.is_dir()
+    assert not (tmp_path / "Documents").exists()
+
+
+def test_warmup_creates_only_user_directories_by_default(tmp_path: Path) -> None:
+    env = {"HOME": str(tmp_path / "home"), "XDG_RUNTIME_DIR": str(tmp_path / "run")}
+    env |= {"XDG_DATA_DIRS": str(tmp_path / "site-data"), "XDG_CONFIG_DIRS": str(tmp_path / "site-config")}
+    dirs = Unix("svc-a", env=env)
+    warmup([dirs], ensure_exists=True)
+    assert dirs.user_data_path.is_dir()
+    assert not (tmp_path / "site-data").exists()
+    assert not (tmp_path / "site-config").exists()
+
+
+def test_warmup_leaves_site_directories_of_creating_instances(tmp_path: Path) -> None:
+    (tmp_path / "site").touch()  # no directory can be created below a file, like below a root-owned one
+    env = {"HOME": str(tmp_path / "home"), "XDG_RUNTIME_DIR": str(tmp_path / "run")}
+    env |= {"XDG_DATA_DIRS": str(tmp_path / "site" / "data"), "XDG_CONFIG_DIRS": str(tmp_path / "site" / "config")}
+    dirs = Unix("svc-a", env=env, ensure_exists=True)
+    warmup([dirs], ensure_exists=True)
+    assert dirs.ensure_exists is True
+    assert (tmp_path / "home" / ".local" / "share" / "svc-a").is_dir()
+    assert (tmp_path / "site").is_file()
+
+
+def test_warmup_without_creating(tmp_path: Path) -> None:
+    dirs = Unix("svc-a", env={"HOME": str(tmp_path), "XDG_RUNTIME_DIR": str(tmp_path / "run")})
+    warmup([dirs])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_warmup_rejects_unknown_scope() -> None:
+    with pytest.raises(ValueError, match="shared"):
+        warmup([{"appname": "svc-a"}], scope="shared")
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from platformdirs import DirKind, Provisioned, provision
+from platformdirs.unix import Unix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _tenant(tmp_path: Path, name: str) -> Unix:
+    env = {"HOME": str(tmp_path), "XDG_CACHE_HOME": str(tmp_path / "cache"), "XDG_STATE_HOME": str(tmp_path / "state")}
+    return Unix(name, env=env)
+
+
+def test_provision_creates_every_directory(tmp_path: Path) -> None:
+    tenants = [_tenant(tmp_path, f"svc-{index}") for index in range(20)]
+    outcome = provision([*tenants, tenants[0]], ["cache", DirKind.LOG], max_workers=4)
+    expected = [path for dirs in tenants for path in (dirs.user_cache_path, dirs.user_log_path)]
+    assert list(outcome) == expected
+    assert all(result == Provisioned(created=True, error=None) for result in outcome.values())
+    assert all(path.is_dir() for path in outcome)
+
+
+def test_provision_reports_existing_and_failed(tmp_path: Path) -> None:
+    dirs = _tenant(tmp_path, "svc-a")
+    dirs.user_cache_path.mkdir(parents=True)
+    dirs.user_log_path.parent.mkdir(parents=True)
+    dirs.user_log_path.touch()
+    outcome = provision([dirs], ["cache", "log"])
+    assert outcome[dirs.user_cache_path] == Provisioned(created=False, error=None)
+    assert isinstance(outcome[dirs.user_log_path].error, FileExistsError)
+    assert outcome[dirs.user_log_path].created is False
+
+
+def test_provision_reports_unwritable_parent(tmp_path: Path) -> None:
+    (tmp_path / "cache").touch()
+    dirs = _tenant(tmp_path, "svc-a")
+    outcome = provision([dirs], ["cache", "state"])
+    assert isinstance(outcome[dirs.user_cache_path].error, NotADirectoryError)
+    assert outcome[dirs.user_state_path] == Provisioned(created=True, error=None)
+
+
+def test_provision_every_site_location(tmp_path: Path) -> None:
+    env = {"XDG_DATA_DIRS": os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])}
+    outcome = provision([Unix("svc-a", env=env, multipath=True)], ["data"], scope="site")
+    assert list(outcome) == [tmp_path / "a" / "svc-a", tmp_path / "b" / "svc-a"]
+    assert all(result.created for result in outcome.values())
+
+
+def test_provision_keeps_entries_with_separator(tmp_path: Path) -> None:
+    env = {"XDG_DATA_DIRS": os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")])}
+    name = f"svc{os.pathsep}1"
+    outcome = provision([Unix(name, env=env, multipath=True)], ["data"], scope="site")
+    assert list(outcome) == [tmp_path / "a" / name, tmp_path / "b" / name]
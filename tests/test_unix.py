@@ -4,16 +4,16 @@ import importlib
 import os
 import sys
 import typing
+from pathlib import Path
 from tempfile import gettempdir
 
 import pytest
 
-from platformdirs import unix
+from platformdirs import DirKind, unix
 from platformdirs.unix import Unix
 
 if typing.TYPE_CHECKING:
     from collections.abc import Callable, Iterator
-    from pathlib import Path
 
     from pytest_mock import MockerFixture
 
@@ -368,6 +368,27 @@ def test_site_data_dir_multipath_falls_back_when_xdg_var_is_all_separators(monke
     assert Unix(appname="foo", multipath=True).site_data_dir == os.pathsep.join(dirs)
 
 
+@pytest.mark.parametrize("multipath", [True, False])
+def test_site_dirs_tuple_from_xdg_var(monkeypatch: pytest.MonkeyPatch, multipath: bool) -> None:
+    monkeypatch.setenv("XDG_DATA_DIRS", f"/a{os.pathsep}/b")
+    monkeypatch.setenv("XDG_CONFIG_DIRS", "/c")
+    dirs = Unix(appname="foo", version="1", multipath=multipath)
+    assert dirs.site_data_dirs == (os.path.join("/a", "foo", "1"), os.path.join("/b", "foo", "1"))  # ruff:ignore[os-path-join]
+    assert dirs.site_config_dirs == (os.path.join("/c", "foo", "1"),)  # ruff:ignore[os-path-join]
+    assert dirs.site_applications_dirs == (os.path.join("/a", "applications"), os.path.join("/b", "applications"))  # ruff:ignore[os-path-join]
+    assert dirs.site_cache_dirs == (os.path.join("/var/cache", "foo", "1"),)  # ruff:ignore[os-path-join]
+    assert dirs.site_data_paths == tuple(map(Path, dirs.site_data_dirs))
+    assert dirs.site_data_path == dirs.site_data_paths[0]
+
+
+def test_site_dirs_tuple_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XDG_DATA_DIRS", raising=False)
+    dirs = Unix(appname="foo")
+    assert dirs.site_data_dirs == (os.path.join("/usr/local/share", "foo"), os.path.join("/usr/share", "foo"))  # ruff:ignore[os-path-join]
+    assert dirs.site_data_dirs is Unix(appname="foo").site_data_dirs
+    assert dirs.site_data_paths is Unix(appname="foo").site_data_paths
+
+
 def test_user_media_dir_from_user_dirs_file(
     mocker: MockerFixture, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -406,6 +427,18 @@ def test_user_media_dir_no_user_dirs_file(
     assert Unix().user_documents_dir == "/nonexistent/path/Documents"
 
 
+def test_user_dirs_file_reparsed_after_edit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XDG_DOCUMENTS_DIR", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    user_dirs_file = tmp_path / "user-dirs.dirs"
+    user_dirs_file.write_text('XDG_DOCUMENTS_DIR="$HOME/Before"\n')
+    assert Unix().user_documents_dir == f"{tmp_path}/Before"
+
+    user_dirs_file.write_text('XDG_DOCUMENTS_DIR="$HOME/AfterEdit"\n')
+    assert Unix().user_documents_dir == f"{tmp_path}/AfterEdit"
+
+
 def test_user_dirs_respects_xdg_config_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("XDG_DOCUMENTS_DIR", raising=False)
     custom_config = tmp_path / "custom_config"
@@ -549,3 +582,148 @@ def test_iter_dirs_as_non_root_keeps_user_dir(
     assert len(result) == 2
     assert result[0] != expected
     assert result[1] == expected
+
+
+def test_resolve_all_reads_user_dirs_once(
+    mocker: MockerFixture, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "user-dirs.dirs").write_text('XDG_DOCUMENTS_DIR="$HOME/Docs"\n')
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", "/home/example")
+    monkeypatch.delenv("XDG_DOCUMENTS_DIR", raising=False)
+    read = mocker.spy(unix, "_read_user_dirs")
+    resolved = Unix().resolve_all()
+    assert resolved["user_documents_dir"] == "/home/example/Docs"
+    assert read.call_count == 1
+
+
+def test_unique_dirs_drop_repeated_xdg_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", "/a")
+    monkeypatch.setenv("XDG_CONFIG_DIRS", os.pathsep.join(["/a", "/b", "/a"]))
+    assert Unix().unique_dirs("config") == ("/a", "/b")
+    assert Unix().unique_paths(DirKind.CONFIG) == (Path("/a"), Path("/b"))
+
+
+def test_unique_dirs_same_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "real").mkdir()
+    (tmp_path / "alias").symlink_to(tmp_path / "real")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "real"))
+    monkeypatch.setenv("XDG_DATA_DIRS", os.pathsep.join([str(tmp_path / "alias"), str(tmp_path / "missing")]))
+    dirs = Unix()
+    assert dirs.unique_dirs("data") == (str(tmp_path / "real"), str(tmp_path / "alias"), str(tmp_path / "missing"))
+    assert dirs.unique_dirs("data", same_file=True) == (str(tmp_path / "real"), str(tmp_path / "missing"))
+
+
+def test_unique_dirs_follow_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    dirs = Unix()
+    monkeypatch.setenv("XDG_STATE_HOME", "/a")
+    assert dirs.unique_dirs("state")[0] == "/a"
+    monkeypatch.setenv("XDG_STATE_HOME", "/b")
+    assert dirs.unique_dirs("state")[0] == "/b"
+
+
+def test_unique_dirs_invalid_kind() -> None:
+    with pytest.raises(ValueError, match="no iterator for documents directories"):
+        Unix().unique_dirs("documents")
+
+
+def test_env_mapping_replaces_process_environment(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "user-dirs.dirs").write_text('XDG_MUSIC_DIR="$HOME/Tunes"\n')
+    monkeypatch.setenv("HOME", "/home/supervisor")
+    monkeypatch.setenv("XDG_CACHE_HOME", "/supervisor/cache")
+    env = {"HOME": "/home/worker", "XDG_CONFIG_HOME": str(tmp_path), "XDG_DATA_DIRS": "/opt/a:/opt/b"}
+    dirs = Unix("MyApp", env=env, multipath=True)
+    assert dirs.user_cache_dir == "/home/worker/.cache/MyApp"
+    assert dirs.user_music_dir == "/home/worker/Tunes"
+    assert dirs.user_documents_dir == "/home/worker/Documents"
+    assert dirs.site_data_dir == "/opt/a/MyApp:/opt/b/MyApp"
+    assert Unix("MyApp").user_cache_dir == "/supervisor/cache/MyApp"
+
+
+def test_fingerprint_tracks_user_dirs_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    dirs = Unix()
+    before = dirs.fingerprint()
+    (tmp_path / "user-dirs.dirs").write_text('XDG_MUSIC_DIR="/music"\n')
+    assert dirs.fingerprint() != before
+    assert dirs.refresh()["user_music_dir"] == "/music"
+
+
+def test_use_site_for_root_follows_privilege_drop(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_DATA_HOME", "/home/worker/.local/share")
+    getuid = mocker.patch("platformdirs.unix.getuid", return_value=0)
+    dirs = Unix("foo", use_site_for_root=True)
+    assert dirs.user_data_dir == "/usr/local/share/foo"
+    getuid.return_value = 1000
+    assert dirs.user_data_dir == "/home/worker/.local/share/foo"
+
+
+def test_home_lookup_follows_uid(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("HOME")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    mocker.patch("pwd.getpwuid", side_effect=lambda uid: mocker.Mock(pw_dir=f"/home/{uid}"))
+    uid = mocker.patch("platformdirs.api._uid", return_value=0)
+    assert Unix("foo").user_cache_dir == "/home/0/.cache/foo"
+    uid.return_value = 1000
+    assert Unix("foo").user_cache_dir == "/home/1000/.cache/foo"
+
+
+def _passwd(name: str, uid: int, home: str | None = None) -> typing.Any:  # ruff:ignore[any-type]
+    pwd = pytest.importorskip("pwd")
+    return pwd.struct_passwd((name, "x", uid, uid, "", home or f"/home/{name}", "/bin/sh"))
+
+
+def test_for_user_resolves_from_home(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", "/root/.cache")
+    dirs = Unix.for_user(_passwd("alice", 1234), "MyApp", env={"XDG_STATE_HOME": "/scratch/alice"})
+    assert dirs.user_cache_dir == "/home/alice/.cache/MyApp"
+    assert dirs.user_state_dir == "/scratch/alice/MyApp"
+    assert dirs.user_runtime_dir in {"/run/user/1234/MyApp", f"{gettempdir()}/runtime-1234/MyApp"}
+
+
+def test_for_user_use_site_follows_user(mocker: MockerFixture) -> None:
+    mocker.patch("platformdirs.unix.getuid", return_value=0)
+    assert Unix.for_user(_passwd("alice", 1234), "foo", use_site_for_root=True).user_data_dir == (
+        "/home/alice/.local/share/foo"
+    )
+    assert Unix.for_user(_passwd("root", 0), "foo", use_site_for_root=True).user_data_dir == "/usr/local/share/foo"
+
+
+def test_for_user_takes_part_in_config() -> None:
+    alice = Unix.for_user(_passwd("alice", 1234), "MyApp")
+    shared = Unix.for_user(_passwd("shared", 1235, home="/home/alice"), "MyApp")
+    assert alice.config() != shared.config()
+    assert alice.config().user_id == 1234
+    created = alice.config().create()
+    assert created.config() == alice.config()
+    assert created.user_runtime_dir == alice.user_runtime_dir
+    assert Unix("MyApp").config().user_id is None
+
+
+def test_for_user_repr() -> None:
+    dirs = Unix.for_user(_passwd("alice", 1234), "MyApp")
+    assert repr(dirs).startswith("Unix.for_user(1234, appname='MyApp', ")
+    assert repr(dirs).endswith(", env=<1 variables>)")
+
+
+@pytest.mark.parametrize(
+    ("user", "lookup"),
+    [pytest.param(1234, "getpwuid", id="uid"), pytest.param("alice", "getpwnam", id="name")],
+)
+def test_for_user_looks_up(mocker: MockerFixture, user: int | str, lookup: str) -> None:
+    entry = _passwd("alice", 1234)
+    mock = mocker.patch(f"pwd.{lookup}", return_value=entry)
+    assert Unix.for_user(user).user_cache_dir == "/home/alice/.cache"
+    mock.assert_called_once_with(user)
+
+
+def test_for_users_reads_password_database_once(mocker: MockerFixture) -> None:
+    getpwall = mocker.patch("pwd.getpwall", return_value=[_passwd("alice", 1234), _passwd("bob", 1235)])
+    getpwnam = mocker.patch("pwd.getpwnam")
+    dirs = Unix.for_users("MyApp", env={"bob": {"XDG_CACHE_HOME": "/scratch/bob"}})
+    assert {name: user.user_cache_dir for name, user in dirs.items()} == {
+        "alice": "/home/alice/.cache/MyApp",
+        "bob": "/scratch/bob/MyApp",
+    }
+    getpwall.assert_called_once_with()
+    getpwnam.assert_not_called()
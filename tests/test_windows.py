@@ -134,6 +134,16 @@ def test_appauthor_explicit() -> None:
     assert result == os.path.join(_LOCAL, "bar", "foo")  # ruff:ignore[os-path-join]
 
 
+def test_suffix_follows_attribute_changes() -> None:
+    dirs = Windows(appname="foo", appauthor="bar", version="1.0")
+    assert dirs.user_cache_dir == os.path.join(_LOCAL, "bar", "foo", "Cache", "1.0")  # ruff:ignore[os-path-join]
+    dirs.appauthor = False
+    dirs.opinion = False
+    assert dirs.user_cache_dir == os.path.join(_LOCAL, "foo", "1.0")  # ruff:ignore[os-path-join]
+    dirs.version = "2.0"
+    assert dirs.user_cache_dir == os.path.join(_LOCAL, "foo", "2.0")  # ruff:ignore[os-path-join]
+
+
 @pytest.mark.parametrize(
     ("csidl_name", "env_var", "value"),
     [
@@ -173,6 +183,19 @@ def test_get_win_folder_from_env_vars_programs(monkeypatch: pytest.MonkeyPatch)
     assert result.endswith("Programs")
 
 
+def test_get_win_folder_reads_given_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WIN_PD_OVERRIDE_LOCAL_APPDATA", r"C:\process")
+    assert get_win_folder("CSIDL_LOCAL_APPDATA", {"WIN_PD_OVERRIDE_LOCAL_APPDATA": r"C:\worker"}) == r"C:\worker"
+    assert get_win_folder_from_env_vars("CSIDL_APPDATA", {"APPDATA": r"C:\worker\Roaming"}) == r"C:\worker\Roaming"
+
+
+def test_windows_env_passes_mapping(mocker: MockerFixture) -> None:
+    env = {"WIN_PD_OVERRIDE_LOCAL_APPDATA": r"C:\worker"}
+    mock = mocker.patch("platformdirs.windows.get_win_folder", side_effect=lambda csidl, _env: _WIN_FOLDERS[csidl])
+    _result = Windows(appname="foo", env=env).user_cache_dir
+    mock.assert_called_with("CSIDL_LOCAL_APPDATA", env)
+
+
 def test_get_win_folder_from_env_vars_unknown() -> None:
     with pytest.raises(ValueError, match="Unknown CSIDL name"):
         get_win_folder_from_env_vars("CSIDL_BOGUS")
@@ -398,6 +421,29 @@ def test_pick_get_win_folder_ctypes(mocker: MockerFixture) -> None:
             _cleanup_ctypes_mocks()
 
 
+def test_known_folder_lookups_are_shared() -> None:
+    resolver = MagicMock(return_value=r"C:\Users\Test\AppData\Local")
+    cached = windows._cache_known_folders(resolver)  # ruff:ignore[private-member-access]
+    for _ in range(3):
+        assert cached("CSIDL_LOCAL_APPDATA") == r"C:\Users\Test\AppData\Local"
+    resolver.assert_called_once_with("CSIDL_LOCAL_APPDATA")
+
+
+def test_clear_known_folders(monkeypatch: pytest.MonkeyPatch) -> None:
+    resolver = MagicMock(side_effect=[r"C:\Users\Test\Documents", r"D:\Documents"])
+    cached = windows._cache_known_folders(resolver)  # ruff:ignore[private-member-access]
+    monkeypatch.setattr(windows, "_resolve_win_folder", cached)
+    assert cached("CSIDL_PERSONAL") == r"C:\Users\Test\Documents"
+    assert cached("CSIDL_PERSONAL") == r"C:\Users\Test\Documents"
+    windows.clear_known_folders()
+    assert cached("CSIDL_PERSONAL") == r"D:\Documents"
+
+
+def test_env_var_folder_lookups_stay_live() -> None:
+    resolver = windows.get_win_folder_from_env_vars
+    assert windows._cache_known_folders(resolver) is resolver  # ruff:ignore[private-member-access]
+
+
 @pytest.mark.parametrize(
     ("csidl_name", "env_suffix"),
     [